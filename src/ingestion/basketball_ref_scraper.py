@@ -2,14 +2,21 @@
 Basketball Reference Web Scraper - Production Version
 Uses surgical string extraction to handle hidden tables in HTML comments
 """
-import json
+import gzip
+import hashlib
+import html
 import logging
+import os
+import random
 import re
+import threading
 import time
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable, get_args
 
-from bs4 import BeautifulSoup
+import orjson
 from curl_cffi import requests
 
 from src.storage.storage_interface import get_storage
@@ -21,8 +28,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns (used on every player scrape)
+_YRS_RE = re.compile(r'^\d+\s+Yrs')
 
-@dataclass
+# Table rows/cells - the stats tables are parsed with these instead of an HTML parser
+_TR_RE = re.compile(r'<tr\b([^>]*)>(.*?)</tr>', re.DOTALL)
+_CELL_RE = re.compile(r'<t([dh])\b[^>]*?data-stat="([^"]+)"[^>]*>(.*?)</t[dh]>', re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_CLASS_ATTR_RE = re.compile(r'class="([^"]*)"')
+
+# Position: <strong>Position:</strong> Shooting Guard &#9642; ..., <strong>Shooting Guard</strong>
+# or Position: Shooting Guard. Character classes instead of .*? keep these
+# free of re.DOTALL
+_POSITION_RES = (
+    re.compile(r'Position:\s*</strong>\s*([^<&]+?)\s*(?:&#9642;|▪|<strong>|Shoots)'),
+    re.compile(r'Position:\s*<strong>([^<]+)</strong>'),
+    re.compile(r'Position:\s*([A-Z][a-z]+\s+[A-Z][a-z]+)'),
+    re.compile(r'Position:\s*([A-Z][a-z]+)'),
+)
+
+# Career span: "1984-2003" or "1984-Present"
+_YEARS_RES = (
+    re.compile(r'(\d{4})\s*-\s*(\d{4})'),
+    re.compile(r'(\d{4})\s*-\s*Present'),
+)
+
+# Accolades: "6× NBA Champ", "5x NBA MVP", "14× All-Star", "11× All-NBA"
+# One alternation so the page is scanned once for all four counts; the
+# group name is the accolade key
+_ACCOLADES_RE = re.compile(
+    r'(?P<championships>\d+)\s*[×x]\s*NBA\s+[Cc]hamp'
+    r'|(?P<mvp_awards>\d+)\s*[×x]\s*(?:NBA\s+Most\s+Valuable\s+Player|NBA\s+MVP|MVP(?=\s|<))'
+    r'|(?P<all_star_selections>\d+)\s*[×x]\s*(?:NBA\s+)?All-Star(?!\s+(?:Game|MVP))'
+    r'|(?P<all_nba_selections>\d+)\s*[×x]\s*All-NBA'
+)
+
+# A one-time award is shown with its season instead of a count
+# ("2011 NBA Champ", "2006-07 MVP"). The label is a plain substring
+# check first; the regex only runs when the label is actually there.
+# Only safe inside the real #bling list - elsewhere on the page (nav,
+# "2025 NBA All-Star Game", "2024 NBA Champions") these forms are links
+_SINGLE_ACCOLADES = {
+    'championships': ('Champ', re.compile(r'\d{4}\s+NBA\s+[Cc]hamp(?!ion)')),
+    'mvp_awards': ('MVP', re.compile(r'\d{4}-\d{2}\s+(?:NBA\s+)?MVP(?=\s|<)')),
+    'all_star_selections': ('All-Star', re.compile(r'\d{4}(?:-\d{2})?\s+(?:NBA\s+)?All-Star(?!\s+(?:Game|MVP))')),
+    'all_nba_selections': ('All-NBA', re.compile(r'\d{4}-\d{2}\s+All-NBA')),
+}
+
+
+@dataclass(slots=True)
 class PlayerStats:
     """Data class representing a player's career statistics"""
     name: str
@@ -55,7 +109,40 @@ class PlayerStats:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, excluding None values"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # Fields are flat primitives, so asdict()'s recursive deepcopy is unnecessary
+        return {name: value for name in _PLAYER_FIELDS if (value := getattr(self, name)) is not None}
+
+
+# Field names in declaration order (computed once, used by to_dict)
+_PLAYER_FIELDS = tuple(f.name for f in fields(PlayerStats))
+
+
+# Parsed text -> field type, derived from the PlayerStats annotations
+# (Optional[int] -> int, Optional[float] -> float, anything else -> str)
+def _field_converter(field_type) -> Callable[[Any], Any]:
+    """Converter for a PlayerStats field's annotated type"""
+    candidates = get_args(field_type) or (field_type,)
+    for numeric in (int, float):
+        if numeric in candidates:
+            return numeric
+    return str
+
+
+_FIELD_CONVERTERS = {f.name: _field_converter(f.type) for f in fields(PlayerStats)}
+
+
+def _env_flag(name: str) -> bool:
+    """True if an on/off environment variable is set to 1, true or yes"""
+    return os.getenv(name, '').strip().lower() in ('1', 'true', 'yes')
+
+
+class _CachedPage:
+    """Stand-in for a response served from the local HTML cache"""
+    status_code = 200
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.headers = {}
 
 
 class BasketballReferenceScraper:
@@ -65,51 +152,250 @@ class BasketballReferenceScraper:
     
     BASE_URL = "https://www.basketball-reference.com"
     MIN_REQUEST_DELAY = 3.0
+    MAX_WORKERS = 4
+    BACKOFF_BASE = 1.0
+    BACKOFF_CAP = 30.0
+    BATCH_KEY = "bronze/players/all_players.jsonl"
+    HTML_CACHE_DIR = Path(".cache/html")
     
-    def __init__(self, storage=None):
-        """Initialize scraper with curl_cffi browser impersonation"""
+    def __init__(self, storage=None, force_refresh: bool = False, per_file: bool = False):
+        """
+        Initialize scraper with curl_cffi browser impersonation
+        
+        Args:
+            storage: DataStore for the Bronze layer (default: get_storage())
+            force_refresh: Skip conditional GETs and re-fetch every page
+            per_file: Save a per-player JSON for every re-fetched page, not
+                only those the conditional-GET cache needs
+        """
         self.storage = storage or get_storage()
-        self.session = requests.Session(impersonate="chrome120")
+        self.force_refresh = force_refresh
+        self.per_file = per_file
+        self._local = threading.local()
+        self._rate_lock = threading.Lock()
         self.last_request_time = 0
+        # ETag/Last-Modified of freshly fetched pages, written next to the
+        # player JSON once that has been saved
+        self._pending_validators: Dict[str, Dict[str, Optional[str]]] = {}
+        # Players parsed from a full (non-304) response this run
+        self._refetched = set()
+    
+    @property
+    def session(self):
+        """Per-thread curl_cffi session (a session is not shared between worker threads)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session(impersonate="chrome120")
+            self._local.session = session
+        return session
     
     def _rate_limit(self):
-        """Enforce minimum delay between requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.MIN_REQUEST_DELAY:
-            sleep_time = self.MIN_REQUEST_DELAY - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+        """
+        Enforce minimum delay between requests (global across worker threads)
+        
+        Each caller reserves the next send slot under the lock and then
+        sleeps outside it, so the lock is never held across a sleep and
+        waiting workers don't serialize behind one another
+        """
+        with self._rate_lock:
+            slot = max(time.monotonic(), self.last_request_time + self.MIN_REQUEST_DELAY)
+            self.last_request_time = slot
+        
+        sleep_time = slot - time.monotonic()
+        if sleep_time > 0:
+            logger.debug("Rate limiting: sleeping for %.2fs", sleep_time)
             time.sleep(sleep_time)
-        self.last_request_time = time.time()
     
-    def _make_request(self, url: str, max_retries: int = 3):
-        """Make HTTP request with exponential backoff"""
+    def _make_request(self, url: str, max_retries: int = 3, headers: Optional[Dict[str, str]] = None):
+        """
+        Make HTTP request with jittered exponential backoff
+        
+        Args:
+            url: Page to fetch
+            max_retries: Attempts before giving up
+            headers: Extra request headers (e.g., conditional-GET validators)
+        
+        Returns:
+            Response (status 200 or 304), or None on failure
+        
+        With SCRAPER_USE_CACHE set, pages are served from (and saved to) a
+        local gzip cache instead of the network - for parser development
+        """
+        use_cache = _env_flag('SCRAPER_USE_CACHE')
+        if use_cache:
+            cached = self._read_html_cache(url)
+            if cached is not None:
+                logger.info("Using cached HTML: %s", url)
+                return cached
+        
+        backoff = self.BACKOFF_BASE
+        slot_reserved = False
         for attempt in range(max_retries):
             try:
-                self._rate_limit()
-                logger.info(f"Fetching: {url} (attempt {attempt + 1}/{max_retries})")
+                if not slot_reserved:
+                    self._rate_limit()
+                slot_reserved = False
+                logger.info("Fetching: %s (attempt %s/%s)", url, attempt + 1, max_retries)
                 
-                response = self.session.get(url, timeout=10)
+                response = self.session.get(url, timeout=10, headers=headers)
                 
-                if response.status_code == 404:
-                    logger.error(f"Player page not found: {url}")
+                if response.status_code == 304:
+                    logger.info("Not modified since last run: %s", url)
+                    return response
+                elif response.status_code == 404:
+                    logger.error("Player page not found: %s", url)
                     return None
-                elif response.status_code == 403:
-                    wait_time = 2 ** attempt * 2
-                    logger.warning(f"403 Forbidden. Retrying in {wait_time}s...")
+                elif response.status_code in (403, 429, 503):
+                    if attempt == max_retries - 1:
+                        logger.error("%s from server on final attempt: %s", response.status_code, url)
+                        break
+                    # Honor the server's Retry-After hint when it sends one,
+                    # unless it asks for longer than we'd ever back off
+                    wait_time = self._retry_after(response)
+                    if wait_time is None:
+                        wait_time = backoff = self._next_backoff(backoff)
+                    elif wait_time > self.BACKOFF_CAP:
+                        logger.error("%s from server with Retry-After %.0fs; giving up on %s",
+                                     response.status_code, wait_time, url)
+                        return None
+                    logger.warning("%s from server. Retrying in %.1fs...", response.status_code, wait_time)
+                    self._hold_requests(wait_time)
                     time.sleep(wait_time)
+                    slot_reserved = True
                     continue
                 
                 response.raise_for_status()
+                if use_cache:
+                    self._write_html_cache(url, response.text)
                 return response
                 
             except Exception as e:
-                logger.error(f"Request failed for {url}: {e}")
+                logger.error("Request failed for %s: %s", url, e)
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    backoff = self._next_backoff(backoff)
+                    time.sleep(backoff)
         
-        logger.error(f"Failed to fetch {url} after {max_retries} attempts")
+        logger.error("Failed to fetch %s after %s attempts", url, max_retries)
         return None
     
+    def _hold_requests(self, delay: float) -> None:
+        """
+        Push the shared send slot out by delay, for every worker
+        
+        The server is refusing the site as a whole, so the other workers
+        wait too; the caller takes the reserved slot itself after sleeping
+        """
+        with self._rate_lock:
+            self.last_request_time = max(self.last_request_time, time.monotonic() + delay)
+    
+    def _next_backoff(self, previous: float) -> float:
+        """
+        Decorrelated-jitter backoff: uniform in [base, 3 * previous], capped
+        
+        Randomizing the wait keeps concurrent workers that were refused
+        together from retrying in lockstep
+        """
+        return min(self.BACKOFF_CAP, random.uniform(self.BACKOFF_BASE, previous * 3))
+    
+    def _retry_after(self, response) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (None if absent or not delta-seconds)"""
+        value = response.headers.get('Retry-After')
+        try:
+            return max(0.0, float(value)) if value else None
+        except ValueError:
+            return None
+    
+    def _html_cache_path(self, url: str) -> Path:
+        """Local cache file for a page's raw HTML"""
+        return self.HTML_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.html.gz"
+    
+    def _read_html_cache(self, url: str) -> Optional['_CachedPage']:
+        """Load a page from the local HTML cache (None if not cached)"""
+        path = self._html_cache_path(url)
+        if not path.exists():
+            return None
+        try:
+            return _CachedPage(gzip.decompress(path.read_bytes()).decode('utf-8'))
+        except Exception as e:
+            logger.warning("Ignoring unreadable HTML cache for %s: %s", url, e)
+            return None
+    
+    def _write_html_cache(self, url: str, text: str) -> None:
+        """Save a fetched page to the local HTML cache"""
+        try:
+            path = self._html_cache_path(url)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(gzip.compress(text.encode('utf-8')))
+        except Exception as e:
+            logger.warning("Could not cache HTML for %s: %s", url, e)
+    
+    def _player_key(self, player_id: str) -> str:
+        """Bronze layer key for a player's parsed stats"""
+        return f"bronze/players/{player_id}.json"
+    
+    def _meta_key(self, player_id: str) -> str:
+        """Bronze layer key for a player page's HTTP cache validators"""
+        return f"bronze/players/{player_id}.meta.json"
+    
+    def _load_cache_validators(self, player_id: str) -> Dict[str, str]:
+        """
+        Build conditional-GET headers from the ETag/Last-Modified saved last run
+        
+        Only used when the parsed player JSON is also in storage, since a
+        304 response is answered from it. Skipped with force_refresh, and
+        with SCRAPER_USE_CACHE: a 304 has no body to fill the HTML cache
+        and would bypass the parser the cache is there to exercise.
+        """
+        if self.force_refresh or _env_flag('SCRAPER_USE_CACHE'):
+            return {}
+        try:
+            if not (self.storage.exists(self._player_key(player_id))
+                    and self.storage.exists(self._meta_key(player_id))):
+                return {}
+            meta = orjson.loads(self.storage.read(self._meta_key(player_id)))
+        except Exception as e:
+            logger.warning("Ignoring cache metadata for %s: %s", player_id, e)
+            return {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def _stage_cache_validators(self, player_id: str, response) -> None:
+        """Hold the page's ETag/Last-Modified until its parsed player is saved"""
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        if any(meta.values()):
+            self._pending_validators[player_id] = meta
+    
+    def _save_cache_validators(self, player_id: str) -> None:
+        """
+        Persist the page's ETag/Last-Modified for the next run's conditional GET
+        
+        Only called after the player JSON is written: validators next to
+        an older JSON would make the next run's 304 serve stale data
+        """
+        meta = self._pending_validators.pop(player_id, None)
+        if not meta:
+            return
+        try:
+            self.storage.write(self._meta_key(player_id), orjson.dumps(meta))
+        except Exception as e:
+            logger.warning("Could not save cache metadata for %s: %s", player_id, e)
+    
+    def _load_cached_player(self, player_id: str) -> Optional[PlayerStats]:
+        """Load the previously parsed player from the Bronze layer"""
+        try:
+            return PlayerStats(**orjson.loads(self.storage.read(self._player_key(player_id))))
+        except Exception as e:
+            logger.warning("Could not load cached data for %s: %s", player_id, e)
+            return None
+    
     def _construct_player_url(self, player_id: str) -> str:
         """Construct player URL from ID"""
         first_letter = player_id[0].lower()
@@ -121,8 +407,8 @@ class BasketballReferenceScraper:
         
         Strategy:
         1. Find a unique data-stat attribute that only appears in the target table
-        2. Walk backwards to find the enclosing <table> tag
-        3. Walk forwards to find the closing </table> tag
+        2. rfind backwards (bounded) for the enclosing <table> tag
+        3. find forwards (bounded) for the closing </table> tag
         4. Extract and return the substring
         
         Args:
@@ -140,301 +426,305 @@ class BasketballReferenceScraper:
                 start_pos = html_text.find(search_pattern)
             
             if start_pos == -1:
-                logger.debug(f"data-stat '{data_stat_identifier}' not found in HTML")
+                logger.debug("data-stat '%s' not found in HTML", data_stat_identifier)
                 return None
             
-            logger.debug(f"Found data-stat='{data_stat_identifier}' at position {start_pos}")
-            
-            # Walk backwards to find the opening <table tag
-            table_start = start_pos
+            # Find the opening <table tag before the data-stat (C-level rfind)
             search_limit = max(0, start_pos - 50000)  # Don't search more than 50KB back
+            table_start = html_text.rfind('<table', search_limit, start_pos)
             
-            while table_start > search_limit:
-                if html_text[table_start:table_start+6].lower() == '<table':
-                    break
-                table_start -= 1
+            if table_start == -1:
+                # Case-insensitive fallback - only lowercase the bounded window
+                table_start = html_text[search_limit:start_pos].lower().rfind('<table')
+                if table_start != -1:
+                    table_start += search_limit
             
-            if table_start == search_limit:
-                logger.warning(f"Could not find <table tag before data-stat '{data_stat_identifier}'")
+            if table_start == -1:
+                logger.warning("Could not find <table tag before data-stat '%s'", data_stat_identifier)
                 return None
             
-            logger.debug(f"Found <table at position {table_start}")
-            
-            # Walk forwards to find the closing </table> tag
-            table_end = start_pos
+            # Find the closing </table> tag after the data-stat
             close_tag = '</table>'
             search_limit = min(len(html_text), start_pos + 100000)  # Don't search more than 100KB forward
+            table_end = html_text.find(close_tag, start_pos, search_limit)
             
-            while table_end < search_limit:
-                if html_text[table_end:table_end+len(close_tag)].lower() == close_tag:
-                    table_end += len(close_tag)
-                    break
-                table_end += 1
+            if table_end == -1:
+                table_end = html_text[start_pos:search_limit].lower().find(close_tag)
+                if table_end != -1:
+                    table_end += start_pos
             
-            if table_end >= search_limit:
-                logger.warning(f"Could not find </table> after data-stat '{data_stat_identifier}'")
+            if table_end == -1:
+                logger.warning("Could not find </table> after data-stat '%s'", data_stat_identifier)
                 return None
             
-            logger.debug(f"Found </table> at position {table_end}")
+            table_end += len(close_tag)
             
-            # Extract the table HTML
+            # Extract the table HTML (unwrapping any comments nested inside it)
             table_html = html_text[table_start:table_end]
+            if '<!--' in table_html:
+                table_html = table_html.replace('<!--', '').replace('-->', '')
             
-            # Remove comment markers if present (Basketball Reference hides tables in comments)
-            table_html = table_html.replace('<!--', '').replace('-->', '')
-            
-            logger.debug(f"Extracted table ({len(table_html)} chars)")
+            logger.debug("Extracted table (%s chars)", len(table_html))
             return table_html
             
         except Exception as e:
-            logger.error(f"Error in surgical extraction: {e}", exc_info=True)
+            logger.error("Error in surgical extraction: %s", e, exc_info=True)
             return None
     
-    def _parse_table_cell(self, cell) -> Optional[str]:
-        """Safely extract text from table cell"""
-        if cell is None:
+    def _extract_sections(self, html_text: str) -> Dict[str, Optional[str]]:
+        """
+        Cut the page into the pieces the four parsers need, once per player
+        
+        Each parser then works on its own small section instead of
+        re-scanning the full page:
+        - per_game / advanced: tables located by a data-stat unique to each
+          ('pts_per_g' only appears in per-game, 'per' only in advanced)
+        - header: everything before the first table
+        - meta: the bio (#meta div) sliced out of the header, falling back
+          to the whole header if missing
+        - bling: the accolades (#bling list), or None if the page has none
+        """
+        header_end = html_text.find('<table')
+        header = html_text[:header_end] if header_end != -1 else html_text
+        return {
+            'per_game': self._extract_table_surgically(html_text, 'pts_per_g'),
+            'advanced': self._extract_table_surgically(html_text, 'per'),
+            'header': header,
+            'meta': self._extract_element(header, 'meta') or header,
+            'bling': self._extract_element(header, 'bling'),
+        }
+    
+    def _extract_element(self, html_text: str, element_id: str) -> Optional[str]:
+        """
+        Slice out the element with the given id through its matching close tag
+        
+        Works for any tag (#meta is a <div>, #bling a <ul>): the tag name is
+        read from the opening tag, then nested opens/closes of that tag are
+        counted with str.find. Returns None if the element isn't on the page.
+        """
+        marker = html_text.find(f'id="{element_id}"')
+        if marker == -1:
             return None
-        text = cell.get_text(strip=True)
+        start = html_text.rfind('<', 0, marker)
+        if start == -1:
+            return None
+        name_end = start + 1
+        while name_end < marker and html_text[name_end].isalnum():
+            name_end += 1
+        tag = html_text[start + 1:name_end]
+        if not tag:
+            return None
+        
+        open_tag, close_tag = f'<{tag}', f'</{tag}>'
+        depth = 0
+        pos = start
+        while True:
+            next_open = html_text.find(open_tag, pos)
+            next_close = html_text.find(close_tag, pos)
+            if next_close == -1:
+                return None
+            if next_open != -1 and next_open < next_close:
+                depth += 1
+                pos = next_open + len(open_tag)
+            else:
+                depth -= 1
+                pos = next_close + len(close_tag)
+                if depth == 0:
+                    return html_text[start:pos]
+    
+    def _parse_table_cell(self, cell_html: Optional[str]) -> Optional[str]:
+        """Safely extract text from a table cell's inner HTML"""
+        if cell_html is None:
+            return None
+        # Most stat cells are bare numbers; only strip tags / unescape when needed
+        text = cell_html
+        if '<' in text:
+            text = _TAG_RE.sub('', text)
+        if '&' in text:
+            text = html.unescape(text)
+        text = text.strip()
         return text if text else None
     
-    def _parse_career_stats(self, html_text: str) -> Dict[str, Any]:
+    def _find_career_row(self, table_html: str) -> Optional[Dict[str, Optional[str]]]:
         """
-        Extract career stats using data-stat attribute (more reliable than table IDs)
+        Locate the Career row in an extracted stats table
+        
+        Basketball Reference shows it as "X Yrs" (e.g., "15 Yrs") or "Career",
+        normally in the tfoot. Rows are matched with regex over the table
+        string, so no parse tree is built.
+        
+        Returns:
+            Mapping of data-stat -> cell text for the row's data cells, or None
+        """
+        def data_cells(row_html: str) -> Dict[str, Optional[str]]:
+            return {
+                stat: self._parse_table_cell(value)
+                for tag, stat, value in _CELL_RE.findall(row_html)
+                if tag == 'd'
+            }
+        
+        def is_labelled(body: str) -> bool:
+            # The label lives in the row's first cell, so only that cell is
+            # checked, and its tags are stripped only if it can match
+            first_end = body.find('</t')
+            first_cell = body[:first_end] if first_end != -1 else body
+            if 'Yrs' not in first_cell and 'Career' not in first_cell:
+                return False
+            label = _TAG_RE.sub('', first_cell).strip()
+            return bool(_YRS_RE.search(label)) or 'Career' in label
+        
+        # Strategy 1: the tfoot. It holds the Career row on nearly every page,
+        # so start the row scan there and skip the season rows entirely
+        tfoot_start = table_html.find('<tfoot')
+        if tfoot_start != -1:
+            for row in _TR_RE.finditer(table_html, tfoot_start):
+                if is_labelled(row.group(2)):
+                    cells = data_cells(row.group(2))
+                    # Make sure it has data cells (not just a header)
+                    if cells:
+                        return cells
+        
+        # Strategies 2 & 3, in one pass over the rows: a labelled row in
+        # tbody, else any row with a "career" class
+        tbody_start = table_html.find('<tbody')
+        tbody_end = table_html.find('</tbody>', tbody_start) if tbody_start != -1 else -1
+        
+        by_class = None
+        for row in _TR_RE.finditer(table_html):
+            attrs, body = row.groups()
+            in_tbody = tbody_start != -1 and tbody_start < row.start() < tbody_end
+            if in_tbody and is_labelled(body):
+                cells = data_cells(body)
+                if cells:
+                    return cells
+            if by_class is None:
+                class_match = _CLASS_ATTR_RE.search(attrs)
+                if class_match and 'career' in class_match.group(1).lower():
+                    by_class = data_cells(body) or None
+        
+        return by_class
+    
+    def _parse_career_stats(self, table_html: Optional[str]) -> Dict[str, Any]:
+        """
+        Extract career stats from the per_game table
+        
+        Args:
+            table_html: Table extracted by _extract_sections (None if missing)
         """
         stats = {}
         
         try:
-            # Extract table by searching for unique data-stat attribute
-            # 'pts_per_g' only appears in the per-game stats table
-            table_html = self._extract_table_surgically(html_text, 'pts_per_g')
-            
             if not table_html:
                 logger.warning("Could not extract per_game table using pts_per_g")
                 return stats
             
-            # Now parse the extracted table with BeautifulSoup
-            soup = BeautifulSoup(table_html, 'html.parser')
-            table = soup.find('table')
-            
-            if not table:
-                logger.warning("Extracted HTML does not contain valid table")
-                return stats
-            
-            # Find the Career row - Basketball Reference shows it as "X Yrs" (e.g., "15 Yrs")
-            career_row = None
-            
-            # Strategy 1: Check tfoot for row starting with number + "Yrs" or "Career"
-            tfoot = table.find('tfoot')
-            if tfoot:
-                logger.debug("Searching tfoot for Career row...")
-                for row in tfoot.find_all('tr'):
-                    row_text = row.get_text().strip()
-                    logger.debug(f"tfoot row text: {row_text[:50]}...")
-                    
-                    # Match patterns like "15 Yrs" or "Career"
-                    if re.search(r'^\d+\s+Yrs', row_text) or 'Career' in row_text:
-                        # Make sure it has data cells (not just a header)
-                        if row.find('td'):
-                            career_row = row
-                            logger.debug(f"Found Career row in tfoot: {row_text[:30]}")
-                            break
-            
-            # Strategy 2: Check tbody for Career row
-            if not career_row:
-                tbody = table.find('tbody')
-                if tbody:
-                    logger.debug("Searching tbody for Career row...")
-                    for row in tbody.find_all('tr'):
-                        row_text = row.get_text().strip()
-                        
-                        # Match "X Yrs" or "Career"
-                        if (re.search(r'^\d+\s+Yrs', row_text) or 'Career' in row_text) and row.find('td'):
-                            career_row = row
-                            logger.debug(f"Found Career row in tbody: {row_text[:30]}")
-                            break
-            
-            # Strategy 3: Look for any row with class containing "career"
-            if not career_row:
-                logger.debug("Searching for row with career class...")
-                career_row = table.find('tr', class_=lambda x: x and 'career' in x.lower())
-                if career_row and career_row.find('td'):
-                    logger.debug("Found Career row by class attribute")
+            career_row = self._find_career_row(table_html)
             
             if not career_row:
                 logger.warning("Could not find Career row in per_game table after trying all strategies")
-                # DEBUG: Print first few rows to see structure
-                logger.debug("First 3 rows of table:")
-                for i, row in enumerate(table.find_all('tr')[:3]):
-                    logger.debug(f"  Row {i}: {row.get_text()[:100]}")
                 return stats
             
-            logger.debug(f"Career row found! Content: {career_row.get_text()[:100]}")
+            logger.debug("Career row found! Cells: %s", career_row.keys())
             
             # Extract stats from the career row
-            stats['games_played'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'g'})
-            )
-            stats['points_per_game'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'pts_per_g'})
-            )
-            stats['rebounds_per_game'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'trb_per_g'})
-            )
-            stats['assists_per_game'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'ast_per_g'})
-            )
-            
-            logger.info(f"Parsed career stats: PPG={stats.get('points_per_game')}, RPG={stats.get('rebounds_per_game')}, APG={stats.get('assists_per_game')}")
+            stats['games_played'] = career_row.get('g')
+            stats['points_per_game'] = career_row.get('pts_per_g')
+            stats['rebounds_per_game'] = career_row.get('trb_per_g')
+            stats['assists_per_game'] = career_row.get('ast_per_g')
+            
+            logger.debug("Parsed career stats: PPG=%s, RPG=%s, APG=%s",
+                         stats['points_per_game'], stats['rebounds_per_game'], stats['assists_per_game'])
             
         except Exception as e:
-            logger.error(f"Error parsing career stats: {e}", exc_info=True)
+            logger.error("Error parsing career stats: %s", e, exc_info=True)
         
         return stats
     
-    def _parse_advanced_stats(self, html_text: str) -> Dict[str, Any]:
+    def _parse_advanced_stats(self, table_html: Optional[str]) -> Dict[str, Any]:
         """
-        Extract advanced stats using data-stat attribute (more reliable)
+        Extract advanced stats from the advanced table
+        
+        Args:
+            table_html: Table extracted by _extract_sections (None if missing)
         """
         stats = {}
         
         try:
-            # Extract table using unique data-stat attribute
-            # 'per' (Player Efficiency Rating) only appears in advanced stats table
-            table_html = self._extract_table_surgically(html_text, 'per')
-            
             if not table_html:
                 logger.warning("Could not extract advanced table using 'per' data-stat")
                 return stats
             
-            # Parse the extracted table
-            soup = BeautifulSoup(table_html, 'html.parser')
-            table = soup.find('table')
-            
-            if not table:
-                logger.warning("Extracted HTML does not contain valid advanced table")
-                return stats
-            
-            # Find Career row - Basketball Reference shows it as "X Yrs" (e.g., "15 Yrs")
-            career_row = None
-            
-            # Strategy 1: Check tfoot for row starting with number + "Yrs" or "Career"
-            tfoot = table.find('tfoot')
-            if tfoot:
-                logger.debug("Searching advanced tfoot for Career row...")
-                for row in tfoot.find_all('tr'):
-                    row_text = row.get_text().strip()
-                    
-                    # Match "X Yrs" or "Career"
-                    if (re.search(r'^\d+\s+Yrs', row_text) or 'Career' in row_text) and row.find('td'):
-                        career_row = row
-                        logger.debug(f"Found Career row in advanced tfoot: {row_text[:30]}")
-                        break
-            
-            # Strategy 2: Check tbody
-            if not career_row:
-                tbody = table.find('tbody')
-                if tbody:
-                    logger.debug("Searching advanced tbody for Career row...")
-                    for row in tbody.find_all('tr'):
-                        row_text = row.get_text().strip()
-                        
-                        if (re.search(r'^\d+\s+Yrs', row_text) or 'Career' in row_text) and row.find('td'):
-                            career_row = row
-                            logger.debug(f"Found Career row in advanced tbody: {row_text[:30]}")
-                            break
-            
-            # Strategy 3: Look for career class
-            if not career_row:
-                career_row = table.find('tr', class_=lambda x: x and 'career' in x.lower())
-                if career_row and career_row.find('td'):
-                    logger.debug("Found Career row in advanced table by class")
+            career_row = self._find_career_row(table_html)
             
             if not career_row:
                 logger.warning("Could not find Career row in advanced table")
                 return stats
             
-            logger.debug(f"Advanced Career row found! Content: {career_row.get_text()[:100]}")
+            logger.debug("Advanced Career row found! Cells: %s", career_row.keys())
             
             # Extract advanced stats
-            stats['player_efficiency_rating'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'per'})
-            )
-            stats['true_shooting_pct'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'ts_pct'})
-            )
-            stats['box_plus_minus'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'bpm'})
-            )
-            stats['win_shares'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'ws'})
-            )
-            stats['win_shares_per_48'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'ws_per_48'})
-            )
-            stats['value_over_replacement'] = self._parse_table_cell(
-                career_row.find('td', {'data-stat': 'vorp'})
-            )
-            
-            logger.info(f"Parsed advanced stats: PER={stats.get('player_efficiency_rating')}, WS={stats.get('win_shares')}")
+            stats['player_efficiency_rating'] = career_row.get('per')
+            stats['true_shooting_pct'] = career_row.get('ts_pct')
+            stats['box_plus_minus'] = career_row.get('bpm')
+            stats['win_shares'] = career_row.get('ws')
+            stats['win_shares_per_48'] = career_row.get('ws_per_48')
+            stats['value_over_replacement'] = career_row.get('vorp')
+            
+            logger.debug("Parsed advanced stats: PER=%s, WS=%s",
+                         stats['player_efficiency_rating'], stats['win_shares'])
             
         except Exception as e:
-            logger.error(f"Error parsing advanced stats: {e}", exc_info=True)
+            logger.error("Error parsing advanced stats: %s", e, exc_info=True)
         
         return stats
     
     def _parse_bio_info(self, html_text: str) -> Dict[str, Any]:
         """
-        Parse biographical information using regex on raw text
-        BeautifulSoup fails because meta div might be in comments or dynamically loaded
+        Parse biographical information from the #meta section with regex
+        
+        The labels are matched in several markup variants (<strong> label,
+        <strong> value, plain text), so small template changes still parse
         """
         info = {}
         
         try:
             # Position - look for the strong tag pattern
-            # Pattern: <strong>Shooting Guard</strong> or Position: Shooting Guard
-            pos_patterns = [
-                r'Position:\s*<strong>([^<]+)</strong>',
-                r'Position:\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-                r'Position:\s*([A-Z][a-z]+)',
-            ]
-            
-            for pattern in pos_patterns:
-                match = re.search(pattern, html_text)
+            for pattern in _POSITION_RES:
+                match = pattern.search(html_text)
                 if match:
                     position = match.group(1).strip()
                     # Clean up any HTML entities or extra text
                     position = position.split('▪')[0].split('•')[0].strip()
                     if position and len(position) < 30:  # Sanity check
                         info['position'] = position
-                        logger.debug(f"Found position: {position}")
+                        logger.debug("Found position: %s", position)
                         break
             
             # Years Active - look for the experience or career span
-            # Patterns: "1984-2003" or "15 years"
-            years_patterns = [
-                r'(\d{4})\s*-\s*(\d{4})',  # 1984-2003
-                r'(\d{4})\s*-\s*Present',   # 1984-Present
-            ]
-            
-            for pattern in years_patterns:
-                match = re.search(pattern, html_text)
+            for pattern in _YEARS_RES:
+                match = pattern.search(html_text)
                 if match:
                     if 'Present' in match.group(0):
                         info['years_active'] = f"{match.group(1)}-Present"
                     else:
                         info['years_active'] = f"{match.group(1)}-{match.group(2)}"
-                    logger.debug(f"Found years active: {info['years_active']}")
+                    logger.debug("Found years active: %s", info['years_active'])
                     break
             
         except Exception as e:
-            logger.error(f"Error parsing bio info: {e}")
+            logger.error("Error parsing bio info: %s", e)
         
         return info
     
-    def _count_accolades(self, html_text: str) -> Dict[str, int]:
+    def _count_accolades(self, html_text: str, single_season: bool = True) -> Dict[str, int]:
         """
-        Count accolades using regex on raw HTML text (Gemini's approach - more reliable)
-        BeautifulSoup can't find the bling div because it's hidden or dynamically loaded
+        Count accolades in the #bling list with one regex pass
+        
+        The first "Nx Award" per accolade wins and the scan stops once all
+        four are found
+        
+        single_season also counts one-time awards shown with their season
+        ("2011 NBA Champ"); only pass it for the real #bling list
         """
         accolades = {
             'championships': 0,
@@ -444,61 +734,29 @@ class BasketballReferenceScraper:
         }
         
         try:
-            # Championships - Pattern: "6× NBA Champ" or "6x NBA champion"
-            champ_patterns = [
-                r'(\d+)\s*[×x]\s*NBA\s+[Cc]hamp(?:ion)?',
-            ]
-            
-            for pattern in champ_patterns:
-                match = re.search(pattern, html_text)
-                if match:
-                    accolades['championships'] = int(match.group(1))
-                    logger.debug(f"Found {accolades['championships']} championships")
-                    break
-            
-            # MVP Awards - Pattern: "5× MVP" or "5x NBA MVP"
-            mvp_patterns = [
-                r'(\d+)\s*[×x]\s*NBA\s+Most\s+Valuable\s+Player',
-                r'(\d+)\s*[×x]\s*NBA\s+MVP',
-                r'(\d+)\s*[×x]\s*MVP(?:\s|<)',  # Must be followed by space or HTML tag
-            ]
-            
-            for pattern in mvp_patterns:
-                match = re.search(pattern, html_text)
-                if match:
-                    accolades['mvp_awards'] = int(match.group(1))
-                    logger.debug(f"Found {accolades['mvp_awards']} MVP awards")
-                    break
-            
-            # All-Star Selections - Pattern: "14× All-Star" or "14x NBA All-Star"
-            allstar_patterns = [
-                r'(\d+)\s*[×x]\s*NBA\s+All-Star',
-                r'(\d+)\s*[×x]\s*All-Star',
-            ]
-            
-            for pattern in allstar_patterns:
-                match = re.search(pattern, html_text)
-                if match:
-                    accolades['all_star_selections'] = int(match.group(1))
-                    logger.debug(f"Found {accolades['all_star_selections']} All-Star selections")
-                    break
-            
-            # All-NBA Selections - Pattern: "11× All-NBA" or "10x All-NBA"
-            allnba_patterns = [
-                r'(\d+)\s*[×x]\s*All-NBA',
-            ]
+            # Single pass; the first occurrence of each accolade wins, and
+            # the scan stops as soon as all four have been seen
+            found = set()
+            for match in _ACCOLADES_RE.finditer(html_text):
+                key = match.lastgroup
+                if key not in found:
+                    found.add(key)
+                    accolades[key] = int(match.group(key))
+                    logger.debug("Found %s %s", accolades[key], key)
+                    if len(found) == len(accolades):
+                        break
             
-            for pattern in allnba_patterns:
-                match = re.search(pattern, html_text)
-                if match:
-                    accolades['all_nba_selections'] = int(match.group(1))
-                    logger.debug(f"Found {accolades['all_nba_selections']} All-NBA selections")
-                    break
+            if single_season:
+                for key, (label, pattern) in _SINGLE_ACCOLADES.items():
+                    if key not in found and label in html_text and pattern.search(html_text):
+                        accolades[key] = 1
             
-            logger.info(f"Accolades: {accolades['championships']} championships, {accolades['mvp_awards']} MVPs, {accolades['all_star_selections']} All-Stars, {accolades['all_nba_selections']} All-NBA")
+            logger.debug("Accolades: %s championships, %s MVPs, %s All-Stars, %s All-NBA",
+                         accolades['championships'], accolades['mvp_awards'],
+                         accolades['all_star_selections'], accolades['all_nba_selections'])
         
         except Exception as e:
-            logger.error(f"Error counting accolades: {e}", exc_info=True)
+            logger.error("Error counting accolades: %s", e, exc_info=True)
         
         return accolades
     
@@ -507,66 +765,135 @@ class BasketballReferenceScraper:
         Scrape all stats for a single player
         """
         url = self._construct_player_url(player_id)
-        logger.info(f"Scraping {player_name} ({player_id})")
+        logger.info("Scraping %s (%s)", player_name, player_id)
+        
+        response = self._make_request(url, headers=self._load_cache_validators(player_id))
+        
+        # Page unchanged since last run - reuse the parsed data, skip parsing
+        if response is not None and response.status_code == 304:
+            player = self._load_cached_player(player_id)
+            if player:
+                logger.info("Using cached data for %s", player_name)
+                return player
+            response = self._make_request(url)
         
-        response = self._make_request(url)
         if not response:
             return None
         
         try:
-            # Work with raw HTML text for surgical extraction
-            html_text = response.text
-            
-            # Initialize player object
-            player = PlayerStats(
-                name=player_name,
-                player_id=player_id,
-                url=url
-            )
-            
-            # Parse different sections
-            career_stats = self._parse_career_stats(html_text)
-            advanced_stats = self._parse_advanced_stats(html_text)
-            bio_info = self._parse_bio_info(html_text)
-            accolades = self._count_accolades(html_text)
-            
-            # Merge all data
-            all_data = {**career_stats, **advanced_stats, **bio_info, **accolades}
-            
-            # Update player object with type conversion
-            for key, value in all_data.items():
-                if hasattr(player, key) and value:
-                    try:
-                        if key in ['games_played', 'championships', 'mvp_awards', 
-                                   'all_star_selections', 'all_nba_selections']:
-                            setattr(player, key, int(value))
-                        elif key in ['points_per_game', 'rebounds_per_game', 'assists_per_game',
-                                     'true_shooting_pct', 'player_efficiency_rating', 'box_plus_minus',
-                                     'win_shares', 'win_shares_per_48', 'value_over_replacement']:
-                            setattr(player, key, float(value))
-                        else:
-                            setattr(player, key, value)
-                    except (ValueError, TypeError):
-                        logger.warning(f"Could not convert {key}={value}")
-            
-            logger.info(f"Successfully scraped {player_name}")
+            player = self._parse_player_page(response.text, player_id, player_name, url)
+            self._stage_cache_validators(player_id, response)
+            self._refetched.add(player_id)
+            
+            logger.info("Successfully scraped %s", player_name)
             return player
             
         except Exception as e:
-            logger.error(f"Error scraping {player_name}: {e}", exc_info=True)
+            logger.error("Error scraping %s: %s", player_name, e, exc_info=True)
             return None
     
+    def _parse_player_page(self, html_text: str, player_id: str, player_name: str, url: str) -> PlayerStats:
+        """
+        Build a PlayerStats from a fetched player page (no I/O)
+        
+        Kept apart from scrape_player so parsing can be run on saved
+        pages without touching the network. Works on the raw page text;
+        tables Basketball Reference hides in comments need no unwrapping,
+        since the <table>...</table> slice sits inside the comment markers.
+        """
+        # Initialize player object
+        player = PlayerStats(
+            name=player_name,
+            player_id=player_id,
+            url=url
+        )
+        
+        # Locate each section once, then parse them
+        sections = self._extract_sections(html_text)
+        career_stats = self._parse_career_stats(sections['per_game'])
+        advanced_stats = self._parse_advanced_stats(sections['advanced'])
+        bio_info = self._parse_bio_info(sections['meta'])
+        # Without a #bling list only the "Nx" counts are looked for in the
+        # header; season-form awards would match nav links there
+        if sections['bling'] is not None:
+            accolades = self._count_accolades(sections['bling'])
+        else:
+            accolades = self._count_accolades(sections['header'], single_season=False)
+        
+        # Merge all data
+        all_data = {**career_stats, **advanced_stats, **bio_info, **accolades}
+        
+        # Update player object with type conversion
+        for key, value in all_data.items():
+            converter = _FIELD_CONVERTERS.get(key)
+            if converter and value:
+                try:
+                    setattr(player, key, converter(value))
+                except (ValueError, TypeError):
+                    logger.warning("Could not convert %s=%s", key, value)
+        
+        return player
+    
+    def needs_player_file(self, player_id: str) -> bool:
+        """
+        Whether a scraped player should get its own Bronze JSON this run
+        
+        The batch JSONL is the Bronze output; per-player files back the
+        conditional-GET cache (a 304 is answered from them). So only pages
+        re-fetched with an ETag/Last-Modified need one, or every re-fetched
+        page with per_file set. Players served from a 304 are already stored
+        """
+        if player_id not in self._refetched:
+            return False
+        return self.per_file or player_id in self._pending_validators
+    
     def save_player_data(self, player: PlayerStats):
         """Save player data to Bronze layer using storage interface"""
         try:
             data = player.to_dict()
-            json_data = json.dumps(data, indent=2)
-            key = f"bronze/players/{player.player_id}.json"
-            self.storage.write(key, json_data.encode('utf-8'))
-            logger.info(f"Saved {player.name} to {key}")
+            key = self._player_key(player.player_id)
+            # orjson serializes straight to UTF-8 bytes in C
+            self.storage.write(key, orjson.dumps(data))
+            logger.info("Saved %s to %s", player.name, key)
         except Exception as e:
-            logger.error(f"Error saving {player.name}: {e}")
+            logger.error("Error saving %s: %s", player.name, e)
             raise
+        self._save_cache_validators(player.player_id)
+    
+    def load_previous_players(self) -> Dict[str, PlayerStats]:
+        """Players from the last saved batch object, by player_id (empty if none)"""
+        try:
+            data = self.storage.read(self.BATCH_KEY)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("Could not load previous batch %s: %s", self.BATCH_KEY, e)
+            return {}
+        
+        players = {}
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                player = PlayerStats(**orjson.loads(line))
+            except Exception as e:
+                logger.warning("Skipping unreadable row in %s: %s", self.BATCH_KEY, e)
+                continue
+            players[player.player_id] = player
+        return players
+    
+    def save_players_batch(self, players: List[PlayerStats]):
+        """
+        Save all players to a single JSON Lines object in the Bronze layer
+        
+        One write for the whole run, so downstream loads read one object
+        instead of listing and fetching a file per player
+        """
+        if not players:
+            return
+        lines = [orjson.dumps(player.to_dict()) for player in players]
+        self.storage.write(self.BATCH_KEY, b'\n'.join(lines) + b'\n')
+        logger.info("Saved %s players to %s", len(players), self.BATCH_KEY)
 
 
 # GOAT Players dictionary
@@ -612,30 +939,66 @@ GOAT_PLAYERS = {
 def main():
     """Main execution function"""
     logger.info("Starting Basketball Reference scraper")
-    logger.info(f"Scraping {len(GOAT_PLAYERS)} players")
+    logger.info("Scraping %s players", len(GOAT_PLAYERS))
     
-    scraper = BasketballReferenceScraper()
+    # SCRAPER_FORCE_REFRESH re-fetches every page instead of sending
+    # conditional GETs against last run's ETag/Last-Modified;
+    # SCRAPER_PER_FILE writes a per-player JSON for every re-fetched page
+    scraper = BasketballReferenceScraper(
+        force_refresh=_env_flag('SCRAPER_FORCE_REFRESH'),
+        per_file=_env_flag('SCRAPER_PER_FILE')
+    )
     
     successful = 0
-    failed = 0
+    failed_ids = []
+    scraped = []
     
-    for player_id, player_name in GOAT_PLAYERS.items():
-        try:
-            player_stats = scraper.scrape_player(player_id, player_name)
-            
-            if player_stats:
-                scraper.save_player_data(player_stats)
-                successful += 1
-            else:
-                failed += 1
-                logger.warning(f"Failed to scrape {player_name}")
-                
-        except Exception as e:
-            failed += 1
-            logger.error(f"Unexpected error scraping {player_name}: {e}")
+    # Fetch/parse players concurrently; _rate_limit keeps the request
+    # pacing global, and results are saved on the main thread
+    with ThreadPoolExecutor(max_workers=scraper.MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(scraper.scrape_player, player_id, player_name): player_id
+            for player_id, player_name in GOAT_PLAYERS.items()
+        }
+        
+        for future in as_completed(futures):
+            player_id = futures[future]
+            player_name = GOAT_PLAYERS[player_id]
+            try:
+                player_stats = future.result()
+            except Exception as e:
+                logger.error("Unexpected error scraping %s: %s", player_name, e)
+                player_stats = None
+            
+            if not player_stats:
+                failed_ids.append(player_id)
+                logger.warning("Failed to scrape %s", player_name)
+                continue
+            
+            scraped.append(player_stats)
+            successful += 1
+            # The per-player file only backs the conditional-GET cache;
+            # failing to write it doesn't drop the player from the batch
+            if scraper.needs_player_file(player_id):
+                try:
+                    scraper.save_player_data(player_stats)
+                except Exception as e:
+                    logger.warning("Per-player file not saved for %s: %s", player_name, e)
+    
+    # The batch object is rewritten every run, so a player whose fetch
+    # failed this time keeps last run's row rather than dropping out
+    if failed_ids:
+        previous = scraper.load_previous_players()
+        for player_id in failed_ids:
+            player = previous.get(player_id) or scraper._load_cached_player(player_id)
+            if player:
+                logger.warning("Keeping previous data for %s", GOAT_PLAYERS[player_id])
+                scraped.append(player)
+    
+    scraper.save_players_batch(scraped)
     
-    logger.info(f"Scraping complete: {successful} successful, {failed} failed")
-    logger.info(f"Data saved to Bronze layer: bronze/players/")
+    logger.info("Scraping complete: %s successful, %s failed", successful, len(failed_ids))
+    logger.info("Data saved to Bronze layer: bronze/players/")
 
 
 if __name__ == "__main__":
@@ -9,9 +9,18 @@ Design Pattern: Strategy Pattern + Dependency Injection
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Protocol, Optional, List
+import io
+from typing import Protocol, Optional, List, BinaryIO, Dict, Any, Iterable
+import logging
 import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
 
 
 class DataStore(Protocol):
@@ -26,6 +35,10 @@ class DataStore(Protocol):
         """Read data from storage."""
         ...
     
+    def open_stream(self, key: str) -> BinaryIO:
+        """Open data for streaming reads (caller closes it)."""
+        ...
+    
     def write(self, key: str, data: bytes) -> None:
         """Write data to storage."""
         ...
@@ -41,6 +54,18 @@ class DataStore(Protocol):
     def delete(self, key: str) -> None:
         """Delete key from storage."""
         ...
+    
+    def write_many(self, items: Dict[str, bytes]) -> None:
+        """Write several keys at once."""
+        ...
+    
+    def read_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Read several keys at once."""
+        ...
+    
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several keys at once."""
+        ...
 
 
 class LocalDataStore:
@@ -56,61 +81,103 @@ class LocalDataStore:
         data = store.read("bronze/players.json")
     """
     
+    # Never listed (and never descended into): OS/editor/tooling clutter
+    IGNORED_NAMES = frozenset({
+        '.DS_Store', '.git', '.pytest_cache', '__pycache__', '.ipynb_checkpoints'
+    })
+    IGNORED_SUFFIXES = ('.swp', '.tmp', '~')
+    
     def __init__(self, base_path: str = "./data"):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
-        print(f"📁 LocalDataStore initialized at: {self.base_path.absolute()}")
+        # Per-key paths are built with os.path on this string rather than
+        # Path arithmetic, which allocates a new Path object per call
+        self._base_str = str(self.base_path)
+        logger.info("LocalDataStore initialized at: %s", self.base_path)
     
     def read(self, key: str) -> bytes:
         """Read file from local storage."""
-        file_path = self.base_path / key
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"Key not found: {key}")
-        
-        with open(file_path, 'rb') as f:
-            return f.read()
+        # open() reports a missing file itself - no separate exists() stat
+        try:
+            with open(os.path.join(self._base_str, key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Key not found: {key}") from None
+    
+    def open_stream(self, key: str) -> BinaryIO:
+        """Open file for streaming reads without loading it into memory."""
+        try:
+            return open(os.path.join(self._base_str, key), 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Key not found: {key}") from None
     
     def write(self, key: str, data: bytes) -> None:
         """Write file to local storage."""
-        file_path = self.base_path / key
+        file_path = os.path.join(self._base_str, key)
         
         # Create parent directories if they don't exist
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
         with open(file_path, 'wb') as f:
             f.write(data)
         
-        print(f"  ✓ Wrote: {key} ({len(data):,} bytes)")
+        logger.debug("Wrote: %s (%d bytes)", key, len(data))
     
     def exists(self, key: str) -> bool:
         """Check if file exists."""
-        return (self.base_path / key).exists()
+        return os.path.isfile(os.path.join(self._base_str, key))
     
     def list_keys(self, prefix: str = "") -> List[str]:
         """List all files with given prefix."""
         search_path = self.base_path / prefix
         
-        if not search_path.exists():
+        if not search_path.is_dir():
             return []
         
-        # Recursively find all files
+        root_key = search_path.relative_to(self.base_path).as_posix()
+        
+        # Walk with os.scandir: DirEntry caches the file type from the
+        # directory read, so there is no extra stat() per entry, and keys
+        # are built by joining names instead of Path.relative_to()
         keys = []
-        for path in search_path.rglob('*'):
-            if path.is_file():
-                # Get relative path from base
-                relative = path.relative_to(self.base_path)
-                keys.append(str(relative))
+        pending = [(str(search_path), '' if root_key == '.' else root_key)]
+        while pending:
+            directory, key_prefix = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (name in self.IGNORED_NAMES or name.startswith('.')
+                            or name.endswith(self.IGNORED_SUFFIXES)):
+                        continue
+                    key = f"{key_prefix}/{name}" if key_prefix else name
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, key))
+                    elif entry.is_file():
+                        keys.append(key)
         
         return sorted(keys)
     
     def delete(self, key: str) -> None:
         """Delete file from local storage."""
-        file_path = self.base_path / key
-        
-        if file_path.exists():
-            file_path.unlink()
-            print(f"  ✓ Deleted: {key}")
+        try:
+            os.remove(os.path.join(self._base_str, key))
+        except FileNotFoundError:
+            return
+        logger.debug("Deleted: %s", key)
+    
+    def write_many(self, items: Dict[str, bytes]) -> None:
+        """Write several files (sequentially - local disk gains nothing from fan-out)."""
+        for key, data in items.items():
+            self.write(key, data)
+    
+    def read_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Read several files."""
+        return {key: self.read(key) for key in keys}
+    
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several files."""
+        for key in keys:
+            self.delete(key)
 
 
 class S3DataStore:
@@ -131,17 +198,45 @@ class S3DataStore:
         store = S3DataStore(bucket="nba-goat-data-lake")
         store.write("bronze/players.json", data)
         data = store.read("bronze/players.json")
-    
-    Note: Currently a placeholder. Will be implemented in Week 5.
     """
     
+    # Objects at or above this size go up as parallel multipart uploads;
+    # smaller ones (e.g. bronze player JSON) stay a single PUT
+    MULTIPART_THRESHOLD = 8 * 1024 * 1024
+    MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+    # Reads fetch this much in the first GET; anything larger is read as
+    # parallel byte-range GETs (one stream tops out well below link rate)
+    RANGE_READ_CHUNKSIZE = 16 * 1024 * 1024
+    # How long object metadata seen by list_keys/exists/write is trusted
+    # before exists() goes back to a HEAD request
+    METADATA_TTL = 60.0
+    # Most recently used keys kept in the metadata cache
+    METADATA_CACHE_SIZE = 10000
+    
     def __init__(self, bucket: str, region: str = "us-east-1"):
         self.bucket = bucket
         self.region = region
         self._client = None
+        self._transfer_config = None
+        # LRU of object metadata; bulk operations update it from worker
+        # threads, so every access goes through _meta_lock
+        self._meta_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._meta_lock = threading.Lock()
+        # Reads currently in progress, so concurrent readers of one key
+        # share a single GET
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Worker threads for the *_many bulk operations (botocore clients
+        # are thread-safe, so one client is shared by all workers)
+        self.max_concurrency = int(os.getenv("S3_CONCURRENCY", "32"))
+        # One pool for the ranged parts of every large read, so concurrent
+        # reads (e.g. from read_many) share max_concurrency threads instead
+        # of each starting their own and exhausting the connection pool
+        self._range_pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="s3-range"
+        )
         
-        print(f"☁️  S3DataStore initialized for bucket: {bucket}")
-        print("⚠️  Note: S3 backend not yet implemented. Using local fallback.")
+        logger.info("S3DataStore initialized for bucket: %s", bucket)
     
     @property
     def client(self):
@@ -149,8 +244,20 @@ class S3DataStore:
         if self._client is None:
             try:
                 import boto3
-                self._client = boto3.client('s3', region_name=self.region)
-                print(f"  ✓ Connected to S3 in region: {self.region}")
+                from botocore.config import Config
+                # One long-lived client: a large keep-alive pool so small
+                # PUTs reuse connections instead of paying a TLS handshake,
+                # and adaptive retries for throttling
+                config = Config(
+                    region_name=self.region,
+                    retries={'max_attempts': 10, 'mode': 'adaptive'},
+                    max_pool_connections=64,
+                    tcp_keepalive=True,
+                    connect_timeout=5,
+                    read_timeout=30
+                )
+                self._client = boto3.client('s3', config=config)
+                logger.info("Connected to S3 in region: %s", self.region)
             except ImportError:
                 raise ImportError(
                     "boto3 not installed. Install with: pip install boto3"
@@ -162,47 +269,200 @@ class S3DataStore:
                 )
         return self._client
     
+    @property
+    def transfer_config(self):
+        """Lazy-load the multipart TransferConfig (only for large writes)."""
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
+            self._transfer_config = TransferConfig(
+                multipart_threshold=self.MULTIPART_THRESHOLD,
+                multipart_chunksize=self.MULTIPART_CHUNKSIZE,
+                max_concurrency=os.cpu_count() or 4,
+                use_threads=True
+            )
+        return self._transfer_config
+    
     def read(self, key: str) -> bytes:
-        """Read object from S3."""
+        """
+        Read object from S3.
+        
+        Small objects are a single GET. Objects over RANGE_READ_CHUNKSIZE
+        are fetched as concurrent byte-range GETs into one buffer. Callers
+        reading a key that is already being fetched wait for that result
+        instead of issuing their own request.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+        
         try:
-            response = self.client.get_object(Bucket=self.bucket, Key=key)
-            return response['Body'].read()
+            data = self._fetch(key)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                # A write/delete may already have detached this read
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+    
+    def _detach_reads(self, keys: Iterable[str]) -> None:
+        """
+        Stop new readers from joining GETs that started before a write/delete.
+        
+        Those GETs may return the old object; later reads start afresh so
+        the store keeps S3's read-after-write behaviour.
+        """
+        with self._inflight_lock:
+            for key in keys:
+                self._inflight.pop(key, None)
+    
+    def _fetch(self, key: str) -> bytes:
+        """
+        GET the first chunk; if the object is larger, fetch the rest in parallel.
+        
+        The first response's Content-Range gives the current size, so small
+        objects cost one request and no HEAD or cached size is trusted.
+        """
+        chunk = self.RANGE_READ_CHUNKSIZE
+        try:
+            try:
+                response = self.client.get_object(
+                    Bucket=self.bucket, Key=key, Range=f"bytes=0-{chunk - 1}"
+                )
+            except Exception as e:
+                if self._error_code(e) != 'InvalidRange':
+                    raise
+                # A zero-length object has no byte 0 to range over
+                response = self.client.get_object(Bucket=self.bucket, Key=key)
+            first = response['Body'].read()
+        except Exception as e:
+            raise FileNotFoundError(f"Key not found in S3: {key}") from e
+        
+        content_range = response.get('ContentRange')
+        size = int(content_range.rsplit('/', 1)[1]) if content_range else len(first)
+        self._remember(key, size=size, etag=response.get('ETag'))
+        if size <= len(first):
+            return first
+        
+        try:
+            return self._read_ranges(key, size, first, response.get('ETag'))
+        except Exception as e:
+            raise IOError(f"Failed to read from S3 (object changed during read?): {key}") from e
+    
+    def _read_ranges(self, key: str, size: int, first: bytes, etag: Optional[str]) -> bytes:
+        """
+        Fetch the rest of an object as parallel ranged GETs into one buffer.
+        
+        Every part is pinned to the first response's ETag (If-Match), so a
+        concurrent overwrite fails the read instead of mixing versions.
+        """
+        buf = bytearray(size)
+        view = memoryview(buf)
+        view[:len(first)] = first
+        chunk = self.RANGE_READ_CHUNKSIZE
+        ranges = [(lo, min(lo + chunk, size) - 1) for lo in range(len(first), size, chunk)]
+        extra = {'IfMatch': etag} if etag else {}
+        
+        def fetch(byte_range):
+            lo, hi = byte_range
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=key, Range=f"bytes={lo}-{hi}", **extra
+            )
+            body = response['Body'].read()
+            if len(body) != hi - lo + 1:
+                raise IOError(f"Short ranged read for {key}: bytes={lo}-{hi}")
+            view[lo:hi + 1] = body
+        
+        list(self._range_pool.map(fetch, ranges))
+        return bytes(buf)
+    
+    @staticmethod
+    def _error_code(error: Exception) -> Optional[str]:
+        """S3 error code of a botocore ClientError (None for other errors)."""
+        return getattr(error, 'response', {}).get('Error', {}).get('Code')
+    
+    def open_stream(self, key: str) -> BinaryIO:
+        """Open object as a streaming body (read in chunks, caller closes it)."""
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=key)['Body']
         except Exception as e:
             raise FileNotFoundError(f"Key not found in S3: {key}") from e
     
     def write(self, key: str, data: bytes) -> None:
         """Write object to S3."""
         try:
-            self.client.put_object(
-                Bucket=self.bucket,
-                Key=key,
-                Body=data,
-                ServerSideEncryption='AES256'  # Encrypt at rest
-            )
-            print(f"  ✓ Wrote to S3: {key} ({len(data):,} bytes)")
+            if len(data) >= self.MULTIPART_THRESHOLD:
+                # Parts are uploaded concurrently over several connections
+                self.client.upload_fileobj(
+                    io.BytesIO(data),
+                    self.bucket,
+                    key,
+                    ExtraArgs={'ServerSideEncryption': 'AES256'},
+                    Config=self.transfer_config
+                )
+            else:
+                self.client.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=data,
+                    ServerSideEncryption='AES256'  # Encrypt at rest
+                )
+            self._remember(key, size=len(data))
+            logger.debug("Wrote to S3: %s (%d bytes)", key, len(data))
         except Exception as e:
             raise IOError(f"Failed to write to S3: {key}") from e
+        finally:
+            self._detach_reads([key])
     
     def exists(self, key: str) -> bool:
-        """Check if object exists in S3."""
-        try:
-            self.client.head_object(Bucket=self.bucket, Key=key)
+        """Check if object exists in S3 (answered from recent metadata when possible)."""
+        with self._meta_lock:
+            cached = self._meta_cache.get(key)
+            if cached:
+                self._meta_cache.move_to_end(key)
+        if cached and time.monotonic() - cached['ts'] < self.METADATA_TTL:
             return True
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
         except:
+            self._forget([key])
             return False
+        self._remember(key, size=response.get('ContentLength'), etag=response.get('ETag'))
+        return True
     
     def list_keys(self, prefix: str = "") -> List[str]:
         """List all objects with given prefix."""
+        return [obj['key'] for obj in self.list_objects(prefix)]
+    
+    def list_objects(self, prefix: str = "") -> List[Dict[str, Any]]:
+        """
+        List all objects with given prefix, with their metadata.
+        
+        Pages through list_objects_v2 (1000 keys per page), so prefixes
+        with more than 1000 objects are not truncated. Size, ETag and
+        LastModified come from the LIST response itself - no HEAD per key.
+        """
         try:
-            response = self.client.list_objects_v2(
-                Bucket=self.bucket,
-                Prefix=prefix
-            )
-            
-            if 'Contents' not in response:
-                return []
-            
-            return [obj['Key'] for obj in response['Contents']]
+            paginator = self.client.get_paginator('list_objects_v2')
+            objects = []
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                for obj in page.get('Contents', ()):
+                    self._remember(obj['Key'], size=obj.get('Size'), etag=obj.get('ETag'))
+                    objects.append({
+                        'key': obj['Key'],
+                        'size': obj.get('Size'),
+                        'etag': obj.get('ETag'),
+                        'last_modified': obj.get('LastModified'),
+                    })
+            return objects
         except Exception as e:
             raise IOError(f"Failed to list S3 keys: {e}") from e
     
@@ -210,9 +470,78 @@ class S3DataStore:
         """Delete object from S3."""
         try:
             self.client.delete_object(Bucket=self.bucket, Key=key)
-            print(f"  ✓ Deleted from S3: {key}")
+            self._forget([key])
+            logger.debug("Deleted from S3: %s", key)
         except Exception as e:
             raise IOError(f"Failed to delete from S3: {key}") from e
+        finally:
+            self._detach_reads([key])
+    
+    def write_many(self, items: Dict[str, bytes]) -> None:
+        """Write several objects concurrently."""
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            list(pool.map(lambda item: self.write(*item), items.items()))
+    
+    def read_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Read several objects concurrently."""
+        keys = list(keys)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            return dict(zip(keys, pool.map(self.read, keys)))
+    
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete several objects with batched DeleteObjects calls (1000 keys each)."""
+        keys = list(keys)
+        for start in range(0, len(keys), 1000):
+            batch = keys[start:start + 1000]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+            except Exception as e:
+                raise IOError(f"Failed to delete from S3: {batch[0]}...") from e
+            finally:
+                self._detach_reads(batch)
+            if response.get('Errors'):
+                failed = [error['Key'] for error in response['Errors']]
+                raise IOError(f"Failed to delete from S3: {failed}")
+            self._forget(batch)
+            logger.debug("Deleted from S3: %d keys", len(batch))
+    
+    def invalidate(self, prefix: str = "") -> None:
+        """Forget cached metadata for keys with given prefix (all keys by default)."""
+        with self._meta_lock:
+            self._forget_locked([k for k in self._meta_cache if k.startswith(prefix)])
+    
+    def _remember(self, key: str, size: Optional[int] = None, etag: Optional[str] = None) -> None:
+        """Cache object metadata so exists() can skip a HEAD request."""
+        with self._meta_lock:
+            self._meta_cache[key] = {'size': size, 'etag': etag, 'ts': time.monotonic()}
+            self._meta_cache.move_to_end(key)
+            while len(self._meta_cache) > self.METADATA_CACHE_SIZE:
+                self._meta_cache.popitem(last=False)
+    
+    def _forget(self, keys: Iterable[str]) -> None:
+        """Drop cached metadata for the given keys."""
+        with self._meta_lock:
+            self._forget_locked(keys)
+    
+    def _forget_locked(self, keys: Iterable[str]) -> None:
+        """Drop cached metadata for the given keys (caller holds _meta_lock)."""
+        for key in keys:
+            self._meta_cache.pop(key, None)
+
+
+@lru_cache(maxsize=8)
+def _local_store(base_path: str) -> LocalDataStore:
+    """Shared LocalDataStore per base path."""
+    return LocalDataStore(base_path=base_path)
+
+
+@lru_cache(maxsize=8)
+def _s3_store(bucket: str, region: str) -> S3DataStore:
+    """Shared S3DataStore (and its boto3 client/connection pool) per bucket and region."""
+    return S3DataStore(bucket=bucket, region=region)
 
 
 def get_storage(storage_type: Optional[str] = None) -> DataStore:
@@ -223,7 +552,9 @@ def get_storage(storage_type: Optional[str] = None) -> DataStore:
         storage_type: "local" or "s3". If None, reads from STORAGE_TYPE env var.
     
     Returns:
-        DataStore implementation (LocalDataStore or S3DataStore)
+        DataStore implementation (LocalDataStore or S3DataStore). Stores are
+        shared: the same configuration returns the same instance, so every
+        caller reuses one S3 client and its connection pool.
     
     Environment Variables:
         STORAGE_TYPE: "local" or "s3" (default: "local")
@@ -246,7 +577,7 @@ def get_storage(storage_type: Optional[str] = None) -> DataStore:
     
     if storage_type == "local":
         base_path = os.getenv("DATA_PATH", "./data")
-        return LocalDataStore(base_path=base_path)
+        return _local_store(base_path)
     
     elif storage_type == "s3":
         bucket = os.getenv("S3_BUCKET")
@@ -256,7 +587,7 @@ def get_storage(storage_type: Optional[str] = None) -> DataStore:
             )
         
         region = os.getenv("AWS_REGION", "us-east-1")
-        return S3DataStore(bucket=bucket, region=region)
+        return _s3_store(bucket, region)
     
     else:
         raise ValueError(
@@ -267,6 +598,7 @@ def get_storage(storage_type: Optional[str] = None) -> DataStore:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
     print("\n=== Testing Storage Interface ===\n")
     
     # Test local storage
@@ -9,17 +9,60 @@ Tests cover:
 - Storage integration
 """
 
+import io
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 import pytest
-from bs4 import BeautifulSoup
 
 from src.ingestion.basketball_ref_scraper import (
     BasketballReferenceScraper,
     PlayerStats,
     GOAT_PLAYERS
 )
+import src.ingestion.basketball_ref_scraper as scraper_module
+
+
+class FakeStorage:
+    """In-memory DataStore for tests; records every write in order"""
+    
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+        self.writes = []
+    
+    def read(self, key):
+        try:
+            return self.data[key]
+        except KeyError:
+            raise FileNotFoundError(f"Key not found: {key}") from None
+    
+    def write(self, key, data):
+        self.data[key] = data
+        self.writes.append((key, data))
+    
+    def exists(self, key):
+        return key in self.data
+    
+    def list_keys(self, prefix=""):
+        return sorted(key for key in self.data if key.startswith(prefix))
+    
+    def delete(self, key):
+        self.data.pop(key, None)
+    
+    def open_stream(self, key):
+        return io.BytesIO(self.read(key))
+    
+    def write_many(self, items):
+        for key, data in items.items():
+            self.write(key, data)
+    
+    def read_many(self, keys):
+        return {key: self.read(key) for key in keys}
+    
+    def delete_many(self, keys):
+        for key in keys:
+            self.delete(key)
 
 
 class TestPlayerStats:
@@ -61,17 +104,14 @@ class TestBasketballReferenceScraper:
     """Tests for BasketballReferenceScraper"""
     
     @pytest.fixture
-    def mock_storage(self):
-        """Create a mock storage interface"""
-        storage = Mock()
-        storage.write = Mock()
-        storage.read = Mock()
-        return storage
+    def storage(self):
+        """Create an in-memory storage backend"""
+        return FakeStorage()
     
     @pytest.fixture
-    def scraper(self, mock_storage):
-        """Create scraper with mock storage"""
-        return BasketballReferenceScraper(storage=mock_storage)
+    def scraper(self, storage):
+        """Create scraper with in-memory storage"""
+        return BasketballReferenceScraper(storage=storage)
     
     def test_construct_player_url(self, scraper):
         """Test URL construction from player ID"""
@@ -88,7 +128,7 @@ class TestBasketballReferenceScraper:
     
     def test_rate_limiting(self, scraper):
         """Test that rate limiting enforces minimum delay"""
-        scraper.last_request_time = time.time()
+        scraper.last_request_time = time.monotonic()
         
         start = time.time()
         scraper._rate_limit()
@@ -100,7 +140,7 @@ class TestBasketballReferenceScraper:
     def test_rate_limiting_no_delay_when_enough_time_passed(self, scraper):
         """Test that rate limiting doesn't delay when enough time has passed"""
         # Set last request time to 10 seconds ago
-        scraper.last_request_time = time.time() - 10
+        scraper.last_request_time = time.monotonic() - 10
         
         start = time.time()
         scraper._rate_limit()
@@ -108,6 +148,21 @@ class TestBasketballReferenceScraper:
         
         # Should not have waited
         assert elapsed < 0.1
+
+    @patch('time.sleep')
+    @patch('time.monotonic', return_value=100.0)
+    def test_rate_limiting_is_global_across_threads(self, mock_monotonic, mock_sleep, scraper):
+        """Test that concurrent workers share one request pacing"""
+        scraper.MIN_REQUEST_DELAY = 0.2
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: scraper._rate_limit(), range(3)))
+        
+        # With the clock frozen, each worker reserved its own slot 0.2s
+        # after the previous one: the first sends at once, the others wait
+        waits = sorted(c[0][0] for c in mock_sleep.call_args_list)
+        assert waits == pytest.approx([0.2, 0.4])
+        assert scraper.last_request_time == pytest.approx(100.4)
     
     @patch('src.ingestion.basketball_ref_scraper.requests.Session.get')
     def test_make_request_success(self, mock_get, scraper):
@@ -143,6 +198,8 @@ class TestBasketballReferenceScraper:
     @patch('time.sleep')
     def test_make_request_retries_on_failure(self, mock_sleep, mock_get, scraper):
         """Test that failed requests are retried with backoff"""
+        # Disable politeness delay so only backoff sleeps are counted
+        scraper.MIN_REQUEST_DELAY = 0
         # Mock failures then success
         mock_get.side_effect = [
             Exception("Connection error"),
@@ -157,28 +214,150 @@ class TestBasketballReferenceScraper:
         # Should have slept twice (after first two failures)
         assert mock_sleep.call_count == 2
     
+    @patch('src.ingestion.basketball_ref_scraper.requests.Session.get')
+    @patch('time.sleep')
+    def test_make_request_honors_retry_after(self, mock_sleep, mock_get, scraper):
+        """Test that a 429 waits for the server's Retry-After instead of the default backoff"""
+        scraper.MIN_REQUEST_DELAY = 0
+        mock_get.side_effect = [
+            Mock(status_code=429, headers={'Retry-After': '7'}),
+            Mock(status_code=200, raise_for_status=Mock()),
+        ]
+        
+        response = scraper._make_request("https://example.com")
+        
+        assert response.status_code == 200
+        mock_sleep.assert_called_once_with(7.0)
+    
+    @patch('src.ingestion.basketball_ref_scraper.requests.Session.get')
+    @patch('time.sleep')
+    def test_make_request_retries_503(self, mock_sleep, mock_get, scraper):
+        """Test that a 503 is retried, honoring Retry-After and falling back to backoff"""
+        scraper.MIN_REQUEST_DELAY = 0
+        mock_get.side_effect = [
+            Mock(status_code=503, headers={'Retry-After': '5'}),
+            Mock(status_code=503, headers={}),
+            Mock(status_code=200, raise_for_status=Mock()),
+        ]
+        
+        response = scraper._make_request("https://example.com")
+        
+        assert response.status_code == 200
+        assert mock_get.call_count == 3
+        first_wait, second_wait = (c[0][0] for c in mock_sleep.call_args_list)
+        assert first_wait == 5.0
+        assert scraper.BACKOFF_BASE <= second_wait <= scraper.BACKOFF_CAP
+    
+    @patch('src.ingestion.basketball_ref_scraper.requests.Session.get')
+    @patch('time.sleep')
+    def test_make_request_gives_up_on_long_retry_after(self, mock_sleep, mock_get, scraper):
+        """Test that a Retry-After beyond BACKOFF_CAP is not waited out"""
+        scraper.MIN_REQUEST_DELAY = 0
+        mock_get.return_value = Mock(status_code=429, headers={'Retry-After': '86400'})
+        
+        assert scraper._make_request("https://example.com") is None
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
+        
+        mock_get.return_value = Mock(status_code=503, headers={'Retry-After': '86400'})
+        assert scraper._make_request("https://example.com") is None
+        assert mock_get.call_count == 2
+        mock_sleep.assert_not_called()
+    
+    @patch('src.ingestion.basketball_ref_scraper.requests.Session.get')
+    @patch('time.sleep')
+    def test_make_request_no_sleep_after_final_attempt(self, mock_sleep, mock_get, scraper):
+        """Test that a refusal on the last attempt returns without waiting again"""
+        scraper.MIN_REQUEST_DELAY = 0
+        mock_get.return_value = Mock(status_code=429, headers={'Retry-After': '2'})
+        
+        assert scraper._make_request("https://example.com", max_retries=3) is None
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_args_list == [((2.0,),), ((2.0,),)]
+    
+    def test_hold_requests_delays_other_workers(self, scraper):
+        """Test that a server refusal pushes back the shared send slot"""
+        scraper._hold_requests(20.0)
+        
+        assert scraper.last_request_time >= time.monotonic() + 19.0
+    
+    def test_next_backoff_is_jittered_and_capped(self, scraper):
+        """Test decorrelated-jitter backoff stays within [base, min(cap, 3 * previous)]"""
+        for previous in (1.0, 4.0, 100.0):
+            for _ in range(50):
+                wait = scraper._next_backoff(previous)
+                assert scraper.BACKOFF_BASE <= wait <= min(scraper.BACKOFF_CAP, previous * 3)
+    
+    @patch('src.ingestion.basketball_ref_scraper.requests.Session.get')
+    def test_make_request_uses_html_cache(self, mock_get, scraper, tmp_path, monkeypatch):
+        """Test that SCRAPER_USE_CACHE serves repeat fetches from disk"""
+        monkeypatch.setenv('SCRAPER_USE_CACHE', '1')
+        scraper.HTML_CACHE_DIR = tmp_path
+        mock_get.return_value = Mock(status_code=200, text='<html>page</html>', raise_for_status=Mock())
+        
+        first = scraper._make_request("https://example.com/page.html")
+        second = scraper._make_request("https://example.com/page.html")
+        
+        assert first.text == second.text == '<html>page</html>'
+        assert second.status_code == 200
+        mock_get.assert_called_once()
+    
+    @patch('src.ingestion.basketball_ref_scraper.requests.Session.get')
+    def test_make_request_cache_flag_off_values(self, mock_get, scraper, tmp_path, monkeypatch):
+        """Test that SCRAPER_USE_CACHE=0/false leaves the HTML cache off"""
+        scraper.MIN_REQUEST_DELAY = 0
+        scraper.HTML_CACHE_DIR = tmp_path
+        mock_get.return_value = Mock(status_code=200, text='<html>page</html>', raise_for_status=Mock())
+        
+        for value in ('0', 'false', 'no', ''):
+            monkeypatch.setenv('SCRAPER_USE_CACHE', value)
+            scraper._make_request("https://example.com")
+        
+        assert mock_get.call_count == 4
+        assert list(tmp_path.iterdir()) == []
+    
     def test_parse_table_cell(self, scraper):
         """Test parsing table cell text"""
         # Test with valid cell
-        html = '<td>25.5</td>'
-        soup = BeautifulSoup(html, 'html.parser')
-        cell = soup.find('td')
-        
-        result = scraper._parse_table_cell(cell)
+        result = scraper._parse_table_cell('25.5')
         assert result == "25.5"
         
+        # Test with nested markup and entities
+        result = scraper._parse_table_cell('<a href="/x.html">Jokić &amp; co</a>')
+        assert result == "Jokić & co"
+        
         # Test with None
         result = scraper._parse_table_cell(None)
         assert result is None
         
         # Test with empty cell
-        html = '<td></td>'
-        soup = BeautifulSoup(html, 'html.parser')
-        cell = soup.find('td')
-        
-        result = scraper._parse_table_cell(cell)
+        result = scraper._parse_table_cell('')
         assert result is None
     
+    def test_extract_table_surgically(self, scraper):
+        """Test locating the enclosing table around a data-stat marker"""
+        html = '<table id="per_game"><tr><td data-stat="pts_per_g">27.1</td></tr></table><p>after</p>'
+        assert scraper._extract_table_surgically(html, 'pts_per_g') == html[:-len('<p>after</p>')]
+
+        # Uppercase tags fall back to a case-insensitive search
+        html = '<TABLE><TR><TD data-stat="per">27.5</TD></TR></TABLE>'
+        assert scraper._extract_table_surgically(html, 'per') == html
+
+        # Marker outside any table
+        assert scraper._extract_table_surgically('<div data-stat="per"></div>', 'per') is None
+
+        # Marker missing entirely
+        assert scraper._extract_table_surgically('<table></table>', 'per') is None
+
+    def test_extract_element(self, scraper):
+        """Test slicing an element by id through its matching close tag"""
+        meta = '<div id="meta"><div><p>Position: Center</p></div><p>1984-2003</p></div>'
+        bling = '<ul id="bling"><li><a>6x NBA Champ</a></li><li>14x All-Star</li></ul>'
+        html = '<div id="info">' + meta + bling + '</div>'
+        assert scraper._extract_element(html, 'meta') == meta
+        assert scraper._extract_element(html, 'bling') == bling
+        assert scraper._extract_element(html, 'missing') is None
+
     def test_parse_career_stats(self, scraper):
         """Test parsing career stats from HTML"""
         # Create mock HTML for Per Game table
@@ -196,14 +375,52 @@ class TestBasketballReferenceScraper:
         </table>
         '''
         
-        soup = BeautifulSoup(html, 'html.parser')
-        stats = scraper._parse_career_stats(soup)
+        stats = scraper._parse_career_stats(html)
         
         assert stats['games_played'] == "1000"
         assert stats['points_per_game'] == "27.1"
         assert stats['rebounds_per_game'] == "7.4"
         assert stats['assists_per_game'] == "7.4"
     
+    def test_parse_career_stats_tbody_fallback(self, scraper):
+        """Test that the Career row is still found when the table has no tfoot"""
+        html = '''
+        <table id="per_game">
+            <tbody>
+                <tr>
+                    <th data-stat="season">2003-04</th>
+                    <td data-stat="g">79</td>
+                    <td data-stat="pts_per_g">20.9</td>
+                </tr>
+                <tr>
+                    <th data-stat="season">21 Yrs</th>
+                    <td data-stat="g">1492</td>
+                    <td data-stat="pts_per_g">27.0</td>
+                </tr>
+            </tbody>
+        </table>
+        '''
+
+        stats = scraper._parse_career_stats(html)
+
+        assert stats['games_played'] == "1492"
+        assert stats['points_per_game'] == "27.0"
+
+    def test_parse_career_stats_class_fallback(self, scraper):
+        """Test that an unlabelled row with a career class is used as a last resort"""
+        html = '''
+        <table id="per_game">
+            <tbody>
+                <tr><th data-stat="season">2003-04</th><td data-stat="g">79</td></tr>
+            </tbody>
+            <tr class="full_table career"><th></th><td data-stat="g">1492</td></tr>
+        </table>
+        '''
+
+        stats = scraper._parse_career_stats(html)
+
+        assert stats['games_played'] == "1492"
+
     def test_parse_advanced_stats(self, scraper):
         """Test parsing advanced stats from HTML"""
         html = '''
@@ -222,8 +439,7 @@ class TestBasketballReferenceScraper:
         </table>
         '''
         
-        soup = BeautifulSoup(html, 'html.parser')
-        stats = scraper._parse_advanced_stats(soup)
+        stats = scraper._parse_advanced_stats(html)
         
         assert stats['player_efficiency_rating'] == "27.5"
         assert stats['true_shooting_pct'] == ".585"
@@ -239,8 +455,7 @@ class TestBasketballReferenceScraper:
         </div>
         '''
         
-        soup = BeautifulSoup(html, 'html.parser')
-        info = scraper._parse_bio_info(soup)
+        info = scraper._parse_bio_info(html)
         
         assert info.get('position') == "Point Guard"
         assert info.get('years_active') == "2003-2023"
@@ -257,14 +472,67 @@ class TestBasketballReferenceScraper:
         </div>
         '''
         
-        soup = BeautifulSoup(html, 'html.parser')
-        accolades = scraper._count_accolades(soup)
+        accolades = scraper._count_accolades(html)
         
         assert accolades['mvp_awards'] == 4
         assert accolades['all_star_selections'] == 19
         assert accolades['all_nba_selections'] == 18
+
+    def test_count_accolades_ignores_finals_mvp(self, scraper):
+        """Test that Finals MVPs are not counted as regular-season MVPs"""
+        html = '''
+        <ul id="bling">
+            <li>14x All Star</li>
+            <li>6x NBA Champ</li>
+            <li>6x Finals MVP</li>
+            <li>5x MVP</li>
+            <li>11x All-NBA</li>
+        </ul>
+        '''
+
+        accolades = scraper._count_accolades(html)
+
+        assert accolades['championships'] == 6
+        assert accolades['mvp_awards'] == 5
+        assert accolades['all_nba_selections'] == 11
+
+    def test_count_accolades_single_season_awards(self, scraper):
+        """Test one-time awards shown with a season instead of a count"""
+        html = '''
+        <ul id="bling">
+            <li><a>14x All-Star</a></li>
+            <li><a>2006-07 MVP</a></li>
+            <li><a>2011 NBA Champ</a></li>
+            <li><a>2011 Finals MVP</a></li>
+        </ul>
+        '''
+
+        accolades = scraper._count_accolades(html)
+
+        assert accolades['championships'] == 1
+        assert accolades['mvp_awards'] == 1
+        assert accolades['all_star_selections'] == 14
+        assert accolades['all_nba_selections'] == 0
+
+    def test_accolades_without_bling_ignore_season_links(self, scraper):
+        """Test that nav links aren't read as one-time awards when #bling is missing"""
+        html = '''
+        <html>
+            <nav>
+                <a href="/allstar/NBA_2025.html">2025 NBA All-Star Game</a>
+                <a href="/playoffs/NBA_2024.html">2024 NBA Champions</a>
+            </nav>
+            <div id="meta"><p>Position: Center</p></div>
+        </html>
+        '''
+        
+        player = scraper._parse_player_page(html, "testpl01", "Test Player", "u")
+        
+        assert not player.championships
+        assert not player.all_star_selections
+        assert scraper._count_accolades('<li>2025 NBA All-Star Game</li>')['all_star_selections'] == 0
     
-    def test_save_player_data(self, scraper, mock_storage):
+    def test_save_player_data(self, scraper, storage):
         """Test saving player data to storage"""
         player = PlayerStats(
             name="Test Player",
@@ -275,13 +543,9 @@ class TestBasketballReferenceScraper:
         
         scraper.save_player_data(player)
         
-        # Verify storage.write was called
-        mock_storage.write.assert_called_once()
-        
-        # Check the call arguments
-        call_args = mock_storage.write.call_args
-        key = call_args[0][0]
-        data = call_args[0][1]
+        # Verify exactly one write was made
+        assert len(storage.writes) == 1
+        key, data = storage.writes[0]
         
         assert key == "bronze/players/testpl01.json"
         
@@ -291,6 +555,46 @@ class TestBasketballReferenceScraper:
         assert parsed['name'] == "Test Player"
         assert parsed['points_per_game'] == 25.5
     
+    def test_save_players_batch(self, scraper, storage):
+        """Test saving all players as one JSON Lines object"""
+        players = [
+            PlayerStats(name="Player One", player_id="onepl01", url="u1", championships=2),
+            PlayerStats(name="Player Two", player_id="twopl01", url="u2"),
+        ]
+        
+        scraper.save_players_batch(players)
+        
+        assert len(storage.writes) == 1
+        key, data = storage.writes[0]
+        assert key == "bronze/players/all_players.jsonl"
+        
+        rows = [json.loads(line) for line in data.decode('utf-8').splitlines()]
+        assert [row['player_id'] for row in rows] == ["onepl01", "twopl01"]
+        assert rows[0]['championships'] == 2
+        assert 'championships' not in rows[1]
+    
+    def test_main_keeps_players_when_saves_or_fetches_fail(self, storage, monkeypatch):
+        """Test that a failed fetch or per-player save doesn't drop a player from the batch"""
+        monkeypatch.setattr(scraper_module, 'GOAT_PLAYERS', {'onepl01': 'Player One', 'twopl01': 'Player Two'})
+        monkeypatch.setattr(scraper_module, 'get_storage', lambda: storage)
+        storage.data[BasketballReferenceScraper.BATCH_KEY] = (
+            json.dumps({'name': 'Player Two', 'player_id': 'twopl01', 'url': 'u2', 'championships': 5}).encode('utf-8') + b'\n'
+        )
+        
+        def scrape_player(self, player_id, player_name):
+            if player_id == 'twopl01':
+                return None
+            return PlayerStats(name=player_name, player_id=player_id, url='u1')
+        monkeypatch.setattr(BasketballReferenceScraper, 'scrape_player', scrape_player)
+        monkeypatch.setattr(BasketballReferenceScraper, 'needs_player_file', lambda self, player_id: True)
+        monkeypatch.setattr(BasketballReferenceScraper, 'save_player_data', Mock(side_effect=IOError("disk full")))
+        
+        scraper_module.main()
+        
+        rows = [json.loads(line) for line in storage.data[BasketballReferenceScraper.BATCH_KEY].splitlines()]
+        assert sorted(row['player_id'] for row in rows) == ['onepl01', 'twopl01']
+        assert next(row for row in rows if row['player_id'] == 'twopl01')['championships'] == 5
+    
     @patch('src.ingestion.basketball_ref_scraper.BasketballReferenceScraper._make_request')
     def test_scrape_player_integration(self, mock_request, scraper):
         """Test full player scraping workflow"""
@@ -335,7 +639,9 @@ class TestBasketballReferenceScraper:
         '''
         
         mock_response = Mock()
-        mock_response.content = mock_html.encode('utf-8')
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.text = mock_html
         mock_request.return_value = mock_response
         
         player = scraper.scrape_player("jamesle01", "LeBron James")
@@ -347,4 +653,162 @@ class TestBasketballReferenceScraper:
         assert player.games_played == 1421
         assert player.points_per_game == 27.2
         assert player.mvp_awards == 4
-        assert player.all_star_selections == 19
\ No newline at end of file
+        assert player.all_star_selections == 19
+    
+    @patch('src.ingestion.basketball_ref_scraper.BasketballReferenceScraper._make_request')
+    def test_scrape_player_not_modified_uses_cached_data(self, mock_request, scraper, storage):
+        """Test that a 304 response reuses the stored player instead of re-parsing"""
+        cached = {
+            'name': 'LeBron James',
+            'player_id': 'jamesle01',
+            'url': 'https://www.basketball-reference.com/players/j/jamesle01.html',
+            'points_per_game': 27.1,
+        }
+        storage.data.update({
+            'bronze/players/jamesle01.json': json.dumps(cached).encode('utf-8'),
+            'bronze/players/jamesle01.meta.json': json.dumps({'etag': '"abc123"'}).encode('utf-8'),
+        })
+        mock_request.return_value = Mock(status_code=304, headers={})
+        
+        player = scraper.scrape_player("jamesle01", "LeBron James")
+        
+        assert player.points_per_game == 27.1
+        mock_request.assert_called_once_with(
+            cached['url'], headers={'If-None-Match': '"abc123"'}
+        )
+    
+    def test_force_refresh_skips_conditional_get(self, scraper, storage):
+        """Test that force_refresh sends no cache validators"""
+        storage.data.update({
+            'bronze/players/jamesle01.json': b'{}',
+            'bronze/players/jamesle01.meta.json': json.dumps({'etag': '"abc123"'}).encode('utf-8'),
+        })
+        
+        assert scraper._load_cache_validators("jamesle01") == {'If-None-Match': '"abc123"'}
+        
+        scraper.force_refresh = True
+        assert scraper._load_cache_validators("jamesle01") == {}
+    
+    @patch('src.ingestion.basketball_ref_scraper.requests.Session.get')
+    def test_html_cache_skips_conditional_get(self, mock_get, scraper, storage, tmp_path, monkeypatch):
+        """Test that with SCRAPER_USE_CACHE a stored ETag doesn't turn the fetch into a 304"""
+        monkeypatch.setenv('SCRAPER_USE_CACHE', '1')
+        scraper.MIN_REQUEST_DELAY = 0
+        scraper.HTML_CACHE_DIR = tmp_path
+        storage.data.update({
+            'bronze/players/jamesle01.json': b'{}',
+            'bronze/players/jamesle01.meta.json': json.dumps({'etag': '"abc123"'}).encode('utf-8'),
+        })
+        mock_get.return_value = Mock(status_code=200, headers={}, text='<html></html>', raise_for_status=Mock())
+        
+        scraper.scrape_player("jamesle01", "LeBron James")
+        
+        assert mock_get.call_args[1]['headers'] == {}
+        assert len(list(tmp_path.iterdir())) == 1
+    
+    @patch('src.ingestion.basketball_ref_scraper.BasketballReferenceScraper._make_request')
+    def test_scrape_player_saves_cache_validators(self, mock_request, scraper, storage):
+        """Test that ETag/Last-Modified are persisted after a full fetch"""
+        mock_request.return_value = Mock(
+            status_code=200,
+            text='<html></html>',
+            headers={'ETag': '"abc123"', 'Last-Modified': 'Tue, 01 Oct 2024 00:00:00 GMT'},
+        )
+        
+        player = scraper.scrape_player("jamesle01", "LeBron James")
+        
+        # Nothing is persisted until the player JSON itself is saved
+        assert storage.writes == []
+        scraper.save_player_data(player)
+        
+        assert [key for key, _ in storage.writes] == [
+            "bronze/players/jamesle01.json",
+            "bronze/players/jamesle01.meta.json",
+        ]
+        assert json.loads(storage.writes[-1][1]) == {
+            'etag': '"abc123"',
+            'last_modified': 'Tue, 01 Oct 2024 00:00:00 GMT',
+        }
+    
+    @patch('src.ingestion.basketball_ref_scraper.BasketballReferenceScraper._make_request')
+    def test_needs_player_file(self, mock_request, scraper, storage):
+        """Test that only re-fetched pages the 304 cache needs get a per-player file"""
+        storage.data.update({
+            'bronze/players/jamesle01.json': json.dumps({'name': 'LeBron James', 'player_id': 'jamesle01', 'url': 'u'}).encode('utf-8'),
+            'bronze/players/jamesle01.meta.json': json.dumps({'etag': '"abc123"'}).encode('utf-8'),
+        })
+        mock_request.side_effect = [
+            Mock(status_code=304, headers={}),
+            Mock(status_code=200, text='<html></html>', headers={'ETag': '"def456"'}),
+            Mock(status_code=200, text='<html></html>', headers={}),
+        ]
+        
+        scraper.scrape_player("jamesle01", "LeBron James")
+        scraper.scrape_player("curryst01", "Stephen Curry")
+        scraper.scrape_player("duranke01", "Kevin Durant")
+        
+        assert not scraper.needs_player_file("jamesle01")
+        assert scraper.needs_player_file("curryst01")
+        assert not scraper.needs_player_file("duranke01")
+        
+        scraper.per_file = True
+        assert not scraper.needs_player_file("jamesle01")
+        assert scraper.needs_player_file("duranke01")
+    
+    @patch('src.ingestion.basketball_ref_scraper.BasketballReferenceScraper._make_request')
+    def test_failed_save_leaves_no_cache_validators(self, mock_request, scraper, storage):
+        """Test that validators aren't written when saving the player JSON fails"""
+        mock_request.return_value = Mock(status_code=200, text='<html></html>', headers={'ETag': '"abc123"'})
+        player = scraper.scrape_player("jamesle01", "LeBron James")
+        
+        storage.write = Mock(side_effect=IOError("disk full"))
+        with pytest.raises(IOError):
+            scraper.save_player_data(player)
+        
+        storage.write.assert_called_once()
+        assert "bronze/players/jamesle01.meta.json" not in storage.data
+    
+    @patch('src.ingestion.basketball_ref_scraper.BasketballReferenceScraper._make_request')
+    def test_scrape_player_reads_tables_hidden_in_comments(self, mock_request, scraper):
+        """Test that tables wrapped in HTML comments are still parsed"""
+        mock_html = '''
+        <html>
+            <div id="meta"><p>Position: Center</p></div>
+            <div class="placeholder"></div>
+            <!--
+            <table id="advanced">
+                <tfoot>
+                    <tr>
+                        <th data-stat="season">Career</th>
+                        <td data-stat="per">26.4</td>
+                        <td data-stat="ws">273.4</td>
+                    </tr>
+                </tfoot>
+            </table>
+            -->
+        </html>
+        '''
+        mock_request.return_value = Mock(status_code=200, headers={}, text=mock_html)
+        
+        player = scraper.scrape_player("abdulka01", "Kareem Abdul-Jabbar")
+        
+        assert player.player_efficiency_rating == 26.4
+        assert player.win_shares == 273.4
+    
+    def test_parse_bio_info_site_markup(self, scraper):
+        """Test parsing position from Basketball Reference's <strong> label markup"""
+        html = '''
+        <div id="meta">
+            <p>
+                <strong>Position:</strong>
+                Shooting Guard
+                &#9642;
+                <strong>Shoots:</strong>
+                Right
+            </p>
+        </div>
+        '''
+        
+        info = scraper._parse_bio_info(html)
+        
+        assert info.get('position') == "Shooting Guard"
@@ -1,14 +1,28 @@
 """Tests for storage interface."""
 
 import pytest
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from src.storage.storage_interface import LocalDataStore, get_storage
+from unittest.mock import Mock
+from src.storage.storage_interface import LocalDataStore, S3DataStore, get_storage
 
 
-def test_local_storage_write_read(tmp_path):
+@pytest.fixture(scope="session")
+def store_root(tmp_path_factory):
+    """One base directory for the whole session; each test gets a subdirectory."""
+    return tmp_path_factory.mktemp("store")
+
+
+@pytest.fixture
+def store(store_root, request):
+    """LocalDataStore in a fresh subdirectory of the session store root."""
+    return LocalDataStore(base_path=str(store_root / request.node.name))
+
+
+def test_local_storage_write_read(store):
     """Test basic write and read operations."""
-    store = LocalDataStore(base_path=str(tmp_path))
-    
     # Write data
     test_data = b"Test NBA data"
     store.write("test/sample.txt", test_data)
@@ -19,10 +33,25 @@ def test_local_storage_write_read(tmp_path):
     assert retrieved == test_data
 
 
-def test_local_storage_exists(tmp_path):
-    """Test file existence check."""
-    store = LocalDataStore(base_path=str(tmp_path))
+def test_local_storage_read_missing_key(store):
+    """Test reading or streaming a missing key raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError, match="Key not found: test/missing.txt"):
+        store.read("test/missing.txt")
+    with pytest.raises(FileNotFoundError, match="Key not found: test/missing.txt"):
+        store.open_stream("test/missing.txt")
+
+
+def test_local_storage_open_stream(store):
+    """Test streaming a stored file in chunks."""
+    store.write("test/stream.bin", b"abcdef")
     
+    with store.open_stream("test/stream.bin") as stream:
+        assert stream.read(4) == b"abcd"
+        assert stream.read() == b"ef"
+
+
+def test_local_storage_exists(store):
+    """Test file existence check."""
     # Initially doesn't exist
     assert not store.exists("test/nonexistent.txt")
     
@@ -31,10 +60,8 @@ def test_local_storage_exists(tmp_path):
     assert store.exists("test/exists.txt")
 
 
-def test_local_storage_list_keys(tmp_path):
+def test_local_storage_list_keys(store):
     """Test listing keys with prefix."""
-    store = LocalDataStore(base_path=str(tmp_path))
-    
     # Write multiple files
     store.write("bronze/file1.json", b"data1")
     store.write("bronze/file2.json", b"data2")
@@ -46,10 +73,277 @@ def test_local_storage_list_keys(tmp_path):
     assert "bronze/file1.json" in bronze_keys
 
 
-def test_get_storage_factory():
+def test_local_storage_list_keys_nested(store):
+    """Test listing walks subdirectories and returns sorted '/' keys."""
+    store.write("bronze/players/b.json", b"b")
+    store.write("bronze/players/a.json", b"a")
+    store.write("bronze/top.json", b"t")
+    
+    assert store.list_keys("bronze") == [
+        "bronze/players/a.json",
+        "bronze/players/b.json",
+        "bronze/top.json",
+    ]
+    assert store.list_keys("bronze/players/") == [
+        "bronze/players/a.json",
+        "bronze/players/b.json",
+    ]
+    assert len(store.list_keys()) == 3
+    
+    # OS / editor clutter is skipped
+    store.write("bronze/.DS_Store", b"")
+    store.write("bronze/__pycache__/x.pyc", b"")
+    store.write("bronze/players/a.json.swp", b"")
+    assert len(store.list_keys()) == 3
+    assert store.list_keys("bronze/top.json") == []
+
+
+def test_s3_write_uses_multipart_for_large_objects():
+    """Test small writes are one PUT and large ones a multipart upload."""
+    store = S3DataStore(bucket="test-bucket")
+    store._client = Mock()
+    store._transfer_config = Mock()
+    
+    store.write("bronze/small.json", b"{}")
+    store._client.put_object.assert_called_once()
+    store._client.upload_fileobj.assert_not_called()
+    
+    store.write("bronze/large.bin", b"x" * store.MULTIPART_THRESHOLD)
+    store._client.put_object.assert_called_once()
+    _, bucket, key = store._client.upload_fileobj.call_args[0]
+    assert (bucket, key) == ("test-bucket", "bronze/large.bin")
+    assert store._client.upload_fileobj.call_args[1]['Config'] is store._transfer_config
+
+
+def test_s3_exists_uses_listed_metadata():
+    """Test exists() skips HEAD for keys just seen by list_keys."""
+    store = S3DataStore(bucket="test-bucket")
+    store._client = Mock()
+    store._client.get_paginator.return_value.paginate.return_value = [
+        {'Contents': [{'Key': 'bronze/a.json', 'Size': 10, 'ETag': '"e1"'}]}
+    ]
+    store._client.head_object.side_effect = Exception("404")
+    
+    assert store.list_keys("bronze") == ['bronze/a.json']
+    assert store.exists('bronze/a.json')
+    store._client.head_object.assert_not_called()
+    
+    # Unlisted key, or after invalidation, falls back to HEAD
+    assert not store.exists('bronze/b.json')
+    store.invalidate("bronze/")
+    assert not store.exists('bronze/a.json')
+    assert store._client.head_object.call_count == 2
+
+
+def test_s3_metadata_cache_is_bounded():
+    """Test the metadata cache evicts least recently used keys past its size."""
+    store = S3DataStore(bucket="test-bucket")
+    store.METADATA_CACHE_SIZE = 2
+    store._client = Mock()
+    store._client.head_object.side_effect = Exception("404")
+    
+    store._remember("bronze/a.json", size=1)
+    store._remember("bronze/b.json", size=1)
+    assert store.exists("bronze/a.json")  # a is now most recently used
+    store._remember("bronze/c.json", size=1)
+    
+    assert list(store._meta_cache) == ["bronze/a.json", "bronze/c.json"]
+    assert not store.exists("bronze/b.json")
+
+
+def test_s3_list_objects_paginates():
+    """Test listing reads every page and keeps LIST metadata."""
+    store = S3DataStore(bucket="test-bucket")
+    store._client = Mock()
+    store._client.get_paginator.return_value.paginate.return_value = [
+        {'Contents': [{'Key': f'bronze/{i}.json', 'Size': i, 'ETag': f'"{i}"'} for i in range(1000)]},
+        {'Contents': [{'Key': 'bronze/last.json', 'Size': 5, 'ETag': '"x"'}]},
+        {},
+    ]
+    
+    objects = store.list_objects("bronze/")
+    
+    store._client.get_paginator.assert_called_once_with('list_objects_v2')
+    assert len(objects) == 1001
+    assert objects[-1] == {'key': 'bronze/last.json', 'size': 5, 'etag': '"x"', 'last_modified': None}
+    assert store.list_keys("bronze/")[-1] == 'bronze/last.json'
+
+
+def _ranged_get_object(objects):
+    """get_object stand-in serving byte ranges of {key: (payload, etag)}."""
+    def get_object(Bucket, Key, Range=None, IfMatch=None):
+        payload, etag = objects[Key]
+        if IfMatch is not None and IfMatch != etag:
+            raise Exception("PreconditionFailed")
+        lo, hi = (int(n) for n in Range[len("bytes="):].split("-"))
+        hi = min(hi, len(payload) - 1)
+        return {
+            'Body': Mock(read=Mock(return_value=payload[lo:hi + 1])),
+            'ContentRange': f"bytes {lo}-{hi}/{len(payload)}",
+            'ETag': etag,
+        }
+    return get_object
+
+
+def test_s3_read_uses_byte_ranges_for_large_objects():
+    """Test large objects are read as ranged GETs and reassembled in order."""
+    store = S3DataStore(bucket="test-bucket")
+    store.RANGE_READ_CHUNKSIZE = 4
+    objects = {"silver/big.parquet": (b"0123456789", '"v1"'), "bronze/small.json": (b"{}", '"s"')}
+    store._client = Mock()
+    store._client.get_object.side_effect = _ranged_get_object(objects)
+    
+    assert store.read("silver/big.parquet") == b"0123456789"
+    calls = [c[1] for c in store._client.get_object.call_args_list]
+    assert sorted(c['Range'] for c in calls) == ['bytes=0-3', 'bytes=4-7', 'bytes=8-9']
+    # Every part after the first is pinned to the first response's version
+    assert all(c['IfMatch'] == '"v1"' for c in calls if c['Range'] != 'bytes=0-3')
+    
+    # Small objects are a single GET, with no HEAD first
+    store._client.reset_mock()
+    assert store.read("bronze/small.json") == b"{}"
+    store._client.head_object.assert_not_called()
+    assert store._client.get_object.call_count == 1
+
+
+def test_s3_ranged_reads_share_one_bounded_pool():
+    """Test concurrent large reads never run more than max_concurrency ranged parts at once."""
+    store = S3DataStore(bucket="test-bucket")
+    store.RANGE_READ_CHUNKSIZE = 2
+    store.max_concurrency = 2
+    store._range_pool = ThreadPoolExecutor(max_workers=2)
+    objects = {f"silver/{i}.parquet": (bytes(range(10)), f'"v{i}"') for i in range(4)}
+    serve = _ranged_get_object(objects)
+    lock = threading.Lock()
+    active, peak = 0, 0
+    
+    def get_object(**kwargs):
+        nonlocal active, peak
+        if kwargs['Range'].startswith("bytes=0-"):
+            return serve(**kwargs)
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return serve(**kwargs)
+    store._client = Mock()
+    store._client.get_object.side_effect = get_object
+    
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(store.read, objects))
+    
+    assert results == [bytes(range(10))] * 4
+    assert peak <= 2
+
+
+def test_s3_read_ignores_stale_cached_size():
+    """Test a read sizes the object from its own GET, not from listed metadata."""
+    store = S3DataStore(bucket="test-bucket")
+    store.RANGE_READ_CHUNKSIZE = 4
+    objects = {"silver/grown.parquet": (b"0123456789", '"v1"')}
+    store._client = Mock()
+    store._client.get_object.side_effect = _ranged_get_object(objects)
+    store._remember("silver/grown.parquet", size=10, etag='"v1"')
+    
+    objects["silver/grown.parquet"] = (b"0123456789abcdef", '"v2"')
+    assert store.read("silver/grown.parquet") == b"0123456789abcdef"
+
+
+def test_s3_read_fails_if_object_changes_mid_read():
+    """Test a ranged read of an overwritten object raises instead of mixing versions."""
+    store = S3DataStore(bucket="test-bucket")
+    store.RANGE_READ_CHUNKSIZE = 4
+    objects = {"silver/big.parquet": (b"0123456789", '"v1"')}
+    store._client = Mock()
+    serve = _ranged_get_object(objects)
+    
+    def get_object(**kwargs):
+        response = serve(**kwargs)
+        objects["silver/big.parquet"] = (b"9876543210", '"v2"')
+        return response
+    store._client.get_object.side_effect = get_object
+    
+    with pytest.raises(IOError) as excinfo:
+        store.read("silver/big.parquet")
+    assert not isinstance(excinfo.value, FileNotFoundError)
+
+
+def test_s3_read_joins_inflight_request():
+    """Test a read of a key already being fetched waits for that GET."""
+    store = S3DataStore(bucket="test-bucket")
+    store._client = Mock()
+    pending = Future()
+    store._inflight["silver/shared.parquet"] = pending
+    
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        waiter = pool.submit(store.read, "silver/shared.parquet")
+        pending.set_result(b"data")
+        assert waiter.result(timeout=5) == b"data"
+    store._client.get_object.assert_not_called()
+    
+    # Once nothing is in flight, reads go to S3 and clean up after themselves
+    del store._inflight["silver/shared.parquet"]
+    store._client.get_object.side_effect = Exception("NoSuchKey")
+    with pytest.raises(FileNotFoundError):
+        store.read("silver/missing.parquet")
+    assert store._inflight == {}
+
+
+def test_s3_read_after_write_skips_older_inflight_read():
+    """Test a read issued after a write doesn't join a GET that began before it."""
+    store = S3DataStore(bucket="test-bucket")
+    store._client = Mock()
+    started, release = threading.Event(), threading.Event()
+    
+    def get_object(Bucket, Key, Range=None):
+        if not started.is_set():
+            started.set()
+            release.wait(timeout=5)
+            return {'Body': Mock(read=Mock(return_value=b"old"))}
+        return {'Body': Mock(read=Mock(return_value=b"new"))}
+    store._client.get_object.side_effect = get_object
+    
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        stale = pool.submit(store.read, "silver/a.json")
+        assert started.wait(timeout=5)
+        store.write("silver/a.json", b"new")
+        fresh = pool.submit(store.read, "silver/a.json")
+        assert fresh.result(timeout=5) == b"new"
+        release.set()
+        assert stale.result(timeout=5) == b"old"
+    assert store._inflight == {}
+
+
+def test_local_storage_bulk_operations(store):
+    """Test writing, reading and deleting several keys at once."""
+    store.write_many({"bulk/a.json": b"a", "bulk/b.json": b"b"})
+    assert store.read_many(["bulk/a.json", "bulk/b.json"]) == {"bulk/a.json": b"a", "bulk/b.json": b"b"}
+    
+    store.delete_many(["bulk/a.json", "bulk/b.json"])
+    assert store.list_keys("bulk") == []
+
+
+def test_s3_delete_many_batches_requests():
+    """Test bulk deletes go out as DeleteObjects calls of at most 1000 keys."""
+    store = S3DataStore(bucket="test-bucket")
+    store._client = Mock()
+    store._client.delete_objects.return_value = {}
+    
+    store.delete_many(f"bronze/{i}.json" for i in range(1500))
+    
+    batches = [c[1]['Delete']['Objects'] for c in store._client.delete_objects.call_args_list]
+    assert [len(batch) for batch in batches] == [1000, 500]
+    store._client.delete_object.assert_not_called()
+
+
+def test_get_storage_factory(store_root, monkeypatch):
     """Test storage factory function."""
+    monkeypatch.setenv("DATA_PATH", str(store_root / "factory"))
     store = get_storage("local")
     assert isinstance(store, LocalDataStore)
+    assert get_storage("local") is store
 
 
 # Add more tests as you build...